@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Async Desktop Organizer
+Runs DesktopOrganizer from asyncio code without blocking the event loop: every
+filesystem call happens on a bounded thread pool, and per-file results are
+streamed as they complete.
+
+    organizer = AsyncOrganizer("/srv/drop", concurrency=8)
+    async for result in organizer.stream():
+        print(result['source'], '->', result['destination'], result['moved'])
+    print(organizer.stats)
+
+    # or, when only the totals matter
+    stats = await AsyncOrganizer("/srv/drop").organize()
+
+Many roots can be organized at once. Pass the same executor to each
+AsyncOrganizer to share one thread limit between them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from desktop_organizer import DesktopOrganizer
+
+
+class AsyncOrganizer:
+    """Asyncio front end for one DesktopOrganizer root."""
+
+    def __init__(self, target_dir: str = None, concurrency: int = 8, executor: ThreadPoolExecutor = None,
+                 **organizer_options):
+        """
+        Initialize the async organizer.
+
+        Args:
+            target_dir: Directory to organize (default: Desktop)
+            concurrency: Maximum number of moves in flight for this root
+            executor: Thread pool to run filesystem calls on (default: a private
+                pool with `concurrency` threads, shut down after each run)
+            **organizer_options: Passed on to DesktopOrganizer (dry_run, layout, verify, ...)
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.organizer = DesktopOrganizer(target_dir=target_dir, **organizer_options)
+        self.concurrency = concurrency
+        self.executor = executor
+        self.cancelled = False
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Statistics of the current or last run (partial after a cancellation)."""
+        return self.organizer.stats
+
+    async def organize(self) -> dict[str, int]:
+        """Organize the root and return the same stats as DesktopOrganizer.organize_files()."""
+        async for _ in self.stream():
+            pass
+        return self.stats
+
+    def _move(self, category: str, source: str, destination: str) -> dict:
+        """Move one planned file (runs on a worker thread)."""
+        organizer = self.organizer
+        size = organizer._get_size_for_history(source)
+        moved = organizer._move_file(source, destination)
+        if moved:
+            with organizer._stats_lock:
+                organizer.bytes_moved += size
+        return {'source': source, 'destination': destination, 'category': category, 'moved': moved}
+
+    async def stream(self):
+        """
+        Organize the root, yielding one result per planned move as it completes:
+        {'source', 'destination', 'category', 'moved'}.
+
+        Cancelling the consuming task (or leaving the loop early) stops new moves
+        from starting; moves already running finish before the cancellation
+        propagates, so the stats always match the files on disk. Cold tier
+        migrations run after the other moves on their own pool and are not
+        streamed; a cancellation stops them the same way. A cancelled scan or
+        report step runs to completion before the cancellation propagates.
+        """
+        executor = self.executor or ThreadPoolExecutor(max_workers=self.concurrency,
+                                                       thread_name_prefix="organizer")
+        organizer = self.organizer
+        self.cancelled = False
+        pending = {}  # asyncio future -> concurrent future
+        stop = threading.Event()
+        blocking = None  # concurrent future of the last _prepare_run, _migrate_cold or _finish_run call
+        try:
+            blocking = executor.submit(organizer._prepare_run)
+            planned_moves = await asyncio.wrap_future(blocking)
+            if planned_moves is None:
+                return
+
+            organizer._start_phase("move")
+            organizer._stats_lock = threading.Lock()
+            cold_moves = []
+            for category, moves in planned_moves.items():
+                for source, destination in moves:
+                    if organizer._is_cold_destination(destination):
+                        cold_moves.append((source, destination))
+                        continue
+                    while len(pending) >= self.concurrency:
+                        for result in await self._wait(pending):
+                            yield result
+                    future = executor.submit(self._move, category, source, destination)
+                    pending[asyncio.wrap_future(future)] = future
+            while pending:
+                for result in await self._wait(pending):
+                    yield result
+            organizer._stats_lock = None  # _migrate_cold installs its own
+
+            if cold_moves:
+                organizer._start_phase("cold")
+                blocking = executor.submit(organizer._migrate_cold, cold_moves, stop)
+                await asyncio.wrap_future(blocking)
+            blocking = executor.submit(organizer._finish_run)
+            await asyncio.wrap_future(blocking)
+        except (asyncio.CancelledError, GeneratorExit):
+            self.cancelled = True
+            raise
+        finally:
+            stop.set()
+            if blocking is not None and not blocking.done():
+                # A running call cannot be cancelled: wait for it (the cold phase
+                # stops starting new moves) before touching the organizer's state
+                waiter = asyncio.wrap_future(blocking)
+                await asyncio.wait([waiter])
+                if not waiter.cancelled() and waiter.exception() is not None:
+                    organizer.logger.error(f"Cancelled run failed in {organizer.target_dir}: "
+                                           f"{waiter.exception()}")
+            if pending:
+                # Drop moves that have not started and wait for the running ones
+                running = [waiter for waiter, future in pending.items() if not future.cancel()]
+                if running:
+                    await asyncio.wait(running)
+            organizer._stats_lock = None
+            if self.cancelled:
+                organizer._start_phase(None)
+                organizer.logger.warning(f"Run cancelled in {organizer.target_dir}: {dict(organizer.stats)}")
+            if self.executor is None:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    async def _wait(pending: dict) -> list[dict]:
+        """Wait until at least one move finishes and return the finished results."""
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in done:
+            del pending[waiter]
+        return [waiter.result() for waiter in done]
+
+
+async def organize_many(roots: list[str], concurrency: int = 8, **organizer_options) -> dict[str, dict[str, int]]:
+    """Organize several roots concurrently on one shared thread pool; returns stats by root."""
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="organizer") as executor:
+        organizers = [AsyncOrganizer(root, concurrency=concurrency, executor=executor, **organizer_options)
+                      for root in roots]
+        results = await asyncio.gather(*(organizer.organize() for organizer in organizers))
+    return {os.path.abspath(root): stats for root, stats in zip(roots, results)}
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for Desktop Organizer
+Measures import cost (python -X importtime) and the end-to-end time of
+`python -m desktop_organizer --fast`, both as a dry run and as a real run that
+moves a few files in a scratch directory (what a watch hook does), and checks
+them against a target budget. Neither run may import argparse or shutil
+(argparse alone costs about 10 ms through re, enum and gettext, shutil about
+6 ms through fnmatch and re). Running the script by path also recompiles it
+every time; that figure is reported for reference only.
+
+Usage:
+  python benchmark_startup.py
+  python benchmark_startup.py --runs 20 --import-budget-ms 4 --run-budget-ms 12
+"""
+
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ORGANIZER = os.path.join(SCRIPT_DIR, "desktop_organizer.py")
+FAST_PATH_FORBIDDEN = ("argparse", "shutil")
+SAMPLE_FILES = ("incoming.jpg", "notes.txt", "report.pdf")
+
+
+def make_scratch_dir(parent: str) -> str:
+    """Create a fresh directory holding the sample files for one real --fast run."""
+    scratch_dir = tempfile.mkdtemp(dir=parent)
+    for name in SAMPLE_FILES:
+        with open(os.path.join(scratch_dir, name), "w") as f:
+            f.write("benchmark")
+    return scratch_dir
+
+
+def measure_import_time(runs: int) -> tuple:
+    """Return (median cumulative import time in ms, heaviest imports) for desktop_organizer."""
+    samples = []
+    heaviest = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import desktop_organizer"],
+            cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+        )
+        rows = []
+        for line in result.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package"
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+            rows.append((int(cumulative_us), name))
+            if name == "desktop_organizer":
+                samples.append(int(cumulative_us) / 1000)
+        heaviest = sorted(rows, reverse=True)[:5]
+    return statistics.median(samples), heaviest
+
+
+def fast_path_imports(options: list) -> list:
+    """Return the forbidden modules imported by a --fast run with the given options."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "desktop_organizer", "--fast"] + options,
+        cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+    )
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+                if line.startswith("import time:")}
+    return [name for name in FAST_PATH_FORBIDDEN if name in imported]
+
+
+def measure_wall_time(command: list, runs: int, scratch_parent: str = None) -> float:
+    """
+    Return the median wall-clock time of a command in ms. With scratch_parent,
+    each run gets a fresh scratch directory as its --target-dir.
+    """
+    samples = []
+    for _ in range(runs):
+        run_command = command
+        if scratch_parent is not None:
+            run_command = command + ["--target-dir", make_scratch_dir(scratch_parent)]
+        start = time.perf_counter()
+        subprocess.run(run_command, cwd=SCRIPT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Desktop Organizer startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement (median is reported)")
+    parser.add_argument("--import-budget-ms", type=float, default=5.0,
+                        help="Budget for the cumulative import time of desktop_organizer")
+    parser.add_argument("--run-budget-ms", type=float, default=15.0,
+                        help="Budget for a --fast run (dry or real) on top of bare interpreter startup")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("   DESKTOP ORGANIZER STARTUP BENCHMARK")
+    print("=" * 50)
+
+    # Measure with the bytecode cache in place, as an installed copy would have it
+    compileall.compile_file(ORGANIZER, quiet=1)
+    import_ms, heaviest = measure_import_time(args.runs)
+    print(f"Import time (median of {args.runs}): {import_ms:.1f} ms (budget {args.import_budget_ms:.1f} ms)")
+    print("Heaviest imports (cumulative):")
+    for cumulative_us, name in heaviest:
+        print(f"  {cumulative_us / 1000:7.1f} ms  {name}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dry_dir = make_scratch_dir(temp_dir)
+        fast_command = [sys.executable, "-m", "desktop_organizer", "--fast"]
+        bare_ms = measure_wall_time([sys.executable, "-c", "pass"], args.runs)
+        dry_ms = measure_wall_time(fast_command + ["--dry-run", "--target-dir", dry_dir], args.runs)
+        real_ms = measure_wall_time(fast_command, args.runs, scratch_parent=temp_dir)
+        script_ms = measure_wall_time(
+            [sys.executable, ORGANIZER, "--fast", "--dry-run", "--target-dir", dry_dir], args.runs
+        )
+        real_dir = make_scratch_dir(temp_dir)
+        forbidden = sorted(set(fast_path_imports(["--dry-run", "--target-dir", dry_dir])
+                               + fast_path_imports(["--target-dir", real_dir])))
+        dry_left = sorted(os.listdir(dry_dir))
+        real_left = sorted(os.listdir(real_dir))
+
+    dry_overhead_ms = dry_ms - bare_ms
+    real_overhead_ms = real_ms - bare_ms
+    print(f"Bare interpreter startup: {bare_ms:.1f} ms")
+    print(f"-m desktop_organizer --fast dry run: {dry_ms:.1f} ms "
+          f"(+{dry_overhead_ms:.1f} ms, budget {args.run_budget_ms:.1f} ms)")
+    print(f"-m desktop_organizer --fast run ({len(SAMPLE_FILES)} files moved): {real_ms:.1f} ms "
+          f"(+{real_overhead_ms:.1f} ms, budget {args.run_budget_ms:.1f} ms)")
+    print(f"desktop_organizer.py --fast dry run (recompiles the script): {script_ms:.1f} ms")
+    if forbidden:
+        print(f"Imported on the --fast path: {', '.join(forbidden)}")
+    sorted_correctly = dry_left == sorted(SAMPLE_FILES) and not set(SAMPLE_FILES) & set(real_left)
+    if not sorted_correctly:
+        print(f"Unexpected target contents: dry run {dry_left}, real run {real_left}")
+
+    print("=" * 50)
+    within_budget = (import_ms <= args.import_budget_ms and max(dry_overhead_ms, real_overhead_ms) <= args.run_budget_ms
+                     and not forbidden)
+    print("WITHIN BUDGET" if within_budget else "OVER BUDGET")
+    print("=" * 50)
+    return 0 if within_budget and sorted_correctly else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,22 +14,606 @@ Features:
 - Cross-platform compatibility with Windows-first design
 """
 
+from __future__ import annotations
+
+# Only the modules needed on every invocation are imported here; shutil,
+# logging, argparse, platform and friends are imported where they are used so
+# that --fast runs from watch hooks start as quickly as possible. Annotations
+# use builtin generics (never evaluated) so typing is not imported either.
 import os
-import glob
-import shutil
-import logging
-import argparse
 import sys
-import platform
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Set
+import time
+from types import MappingProxyType
+
+
+# Destination layouts: "flat" puts everything in <category>/, "date" shards
+# by modification month (<category>/YYYY/MM) and "hash" fans out by a
+# two-character name hash (<category>/ab).
+LAYOUTS = ("flat", "date", "hash")
+
+# Destination checks for --verify: "readback" re-hashes the copy, read past
+# the OS cache where possible (posix_fadvise on Linux, an unbuffered handle on
+# Windows); "metadata" checks the size only, since the copy's mtime is set
+# from the source and cannot disagree with it.
+VERIFY_MODES = ("readback", "metadata")
+VERIFY_CHUNK_SIZE = 1024 * 1024
+UNBUFFERED_ALIGNMENT = 4096  # Sector alignment for unbuffered Windows reads
+
+# Link types for the non-destructive view mode (see DesktopOrganizer.sync_view)
+VIEW_MODES = ("symlink", "hardlink", "reflink")
+VIEW_STATE_FILE = ".organizer_view.json"
+FICLONE = 0x40049409  # Linux ioctl: share extents with another file (btrfs, XFS)
+
+# Two-sided normal quantiles for the confidence levels offered by --estimate
+CONFIDENCE_Z = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
+# Gitignore-style exclusions read from the target directory. The defaults are
+# applied first, so a user rule such as "!.htaccess" can override them.
+IGNORE_FILE_NAME = ".organizerignore"
+DEFAULT_IGNORE_PATTERNS = (".*", "/organizer_logs/")
+IGNORE_BATCH_SIZE = 1024
+
+# Run history: each run is compared with the median throughput of up to
+# HISTORY_BASELINE_RUNS earlier runs on the same root, mode and ruleset; a drop of more than
+# HISTORY_REGRESSION_DROP (with at least HISTORY_MIN_BASELINE runs) is flagged.
+HISTORY_DB_NAME = "history.sqlite3"
+HISTORY_BASELINE_RUNS = 10
+HISTORY_MIN_BASELINE = 3
+HISTORY_REGRESSION_DROP = 0.3
+
+# Cooperative (--shard) runs: advisory lock files live here, inside the target
+LOCK_DIR_NAME = ".organizer_locks"
+DEFAULT_LOCK_LEASE = 60.0
+
+# Cold tier: files untouched (atime and mtime) for --cold-after days move to
+# --cold-root with the same layout; every migration is appended to the index
+COLD_INDEX_NAME = ".organizer_cold_index.jsonl"
+DEFAULT_COLD_WORKERS = 4
+
+# Directory readers for the scan phase. "getdents" (Linux) calls getdents64
+# directly with a large buffer: os.scandir reads 32 KiB per syscall, which on
+# huge flat directories (and network filesystems) means many round trips.
+READERS = ("scandir", "getdents")
+DEFAULT_GETDENTS_BUFFER = 1024 * 1024
+MIN_GETDENTS_BUFFER = 4096
+GETDENTS64_SYSCALLS = {
+    "x86_64": 217, "i386": 220, "i686": 220, "aarch64": 61, "riscv64": 61,
+    "armv7l": 217, "armv6l": 217, "ppc64le": 202, "ppc64": 202, "s390x": 220,
+}
+DT_UNKNOWN, DT_DIR, DT_REG, DT_LNK = 0, 4, 8, 10
+
+ANSI_CLEAR_SCREEN = "\033[2J\033[H"
+
+# Comprehensive file type mapping - Windows-optimized. Built once at import
+# time and exposed read-only so every organizer instance shares it.
+FILE_TYPES = MappingProxyType({
+    # Images
+    "jpg": "images", "jpeg": "images", "png": "images", "gif": "images",
+    "bmp": "images", "tiff": "images", "tif": "images", "svg": "images",
+    "webp": "images", "ico": "images", "raw": "images", "psd": "images",
+
+    # Videos
+    "mp4": "videos", "avi": "videos", "mkv": "videos", "mov": "videos",
+    "wmv": "videos", "flv": "videos", "webm": "videos", "m4v": "videos",
+    "3gp": "videos", "mpg": "videos", "mpeg": "videos", "ogv": "videos",
+
+    # Audio
+    "mp3": "audio", "wav": "audio", "flac": "audio", "aac": "audio",
+    "ogg": "audio", "wma": "audio", "m4a": "audio", "opus": "audio",
+    "aiff": "audio", "amr": "audio",
+
+    # Documents
+    "doc": "documents", "docx": "documents", "pdf": "documents",
+    "txt": "documents", "rtf": "documents", "odt": "documents",
+    "pages": "documents", "tex": "documents",
+
+    # Spreadsheets
+    "xls": "spreadsheets", "xlsx": "spreadsheets", "csv": "spreadsheets",
+    "ods": "spreadsheets", "numbers": "spreadsheets",
+
+    # Presentations
+    "ppt": "presentations", "pptx": "presentations", "odp": "presentations",
+    "key": "presentations",
+
+    # Code files
+    "py": "code", "js": "code", "html": "code", "css": "code",
+    "java": "code", "cpp": "code", "c": "code", "h": "code",
+    "php": "code", "rb": "code", "go": "code", "rs": "code",
+    "swift": "code", "kt": "code", "scala": "code", "pl": "code",
+    "sh": "code", "bat": "code", "cmd": "code", "ps1": "code",
+    "json": "code", "xml": "code", "yaml": "code", "yml": "code",
+    "sql": "code", "md": "code", "ini": "code", "cfg": "code",
+
+    # Applications
+    "exe": "applications", "msi": "applications", "deb": "applications",
+    "rpm": "applications", "dmg": "applications", "pkg": "applications",
+    "app": "applications", "apk": "applications",
+
+    # Archives
+    "zip": "archives", "rar": "archives", "7z": "archives",
+    "tar": "archives", "gz": "archives", "xz": "archives",
+    "bz2": "archives", "tgz": "archives", "tbz2": "archives",
+    "z": "archives", "lz": "archives", "lzma": "archives",
+
+    # Fonts
+    "ttf": "fonts", "otf": "fonts", "woff": "fonts", "woff2": "fonts",
+    "eot": "fonts", "fon": "fonts",
+
+    # E-books
+    "epub": "ebooks", "mobi": "ebooks", "azw": "ebooks", "azw3": "ebooks",
+    "fb2": "ebooks", "lit": "ebooks",
+
+    # Shortcuts
+    "lnk": "shortcuts", "url": "shortcuts", "desktop": "shortcuts",
+})
+
+
+class _ConsoleLogger:
+    """Minimal stand-in for logging.Logger used when file logging is disabled."""
+    
+    def __init__(self, stream=None):
+        self.stream = stream
+    
+    def _write(self, message: str):
+        stream = self.stream or sys.stderr
+        stream.write(f"{message}\n")
+        stream.flush()
+    
+    def info(self, message: str):
+        self._write(message)
+    
+    warning = info
+    error = info
+
+
+class _DirEntry(tuple):
+    """Minimal os.DirEntry stand-in for entries read with getdents64: (name, path, d_type)."""
+    
+    __slots__ = ()
+    
+    # A tuple is much cheaper to build per entry than an object with attributes
+    @property
+    def name(self) -> str:
+        return self[0]
+    
+    @property
+    def path(self) -> str:
+        return self[1]
+    
+    @property
+    def d_type(self) -> int:
+        return self[2]
+    
+    def is_file(self) -> bool:
+        # Like os.DirEntry.is_file(): decided by d_type, stat only for symlinks
+        # (which are followed) and filesystems that do not report a type
+        d_type = self[2]
+        if d_type == DT_REG:
+            return True
+        if d_type == DT_LNK or d_type == DT_UNKNOWN:
+            return os.path.isfile(self[1])
+        return False
+    
+    def stat(self) -> os.stat_result:
+        return os.stat(self[1])
+    
+    def is_dir(self) -> bool:
+        d_type = self[2]
+        if d_type == DT_DIR:
+            return True
+        if d_type == DT_LNK or d_type == DT_UNKNOWN:
+            return os.path.isdir(self[1])
+        return False
+
+
+def load_getdents64():
+    """
+    Return a getdents64(fd, buffer, size) -> bytes read function, or None on
+    platforms without it (anything but Linux on a known architecture).
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    number = GETDENTS64_SYSCALLS.get(os.uname().machine)
+    if number is None:
+        return None
+    import ctypes
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        syscall = libc.syscall
+    except (OSError, AttributeError):
+        return None
+    syscall.restype = ctypes.c_long
+    
+    def getdents64(fd: int, buffer, size: int) -> int:
+        count = syscall(number, ctypes.c_int(fd), buffer, ctypes.c_uint(size))
+        if count < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        return count
+    
+    return getdents64
+
+
+def iter_getdents(path: str, buffer_size: int = DEFAULT_GETDENTS_BUFFER, getdents64=None):
+    """
+    Yield the entries of a directory (without "." and "..") as _DirEntry
+    objects, reading up to buffer_size bytes of records per getdents64 call.
+    """
+    import ctypes
+    getdents64 = getdents64 or load_getdents64()
+    if getdents64 is None:
+        raise OSError("getdents64 is not available on this platform")
+    # struct linux_dirent64 { u64 d_ino; s64 d_off; u16 d_reclen; u8 d_type; char d_name[]; }
+    # Only d_reclen (offset 16, native byte order) and d_type (offset 18) are
+    # needed; the NUL-terminated name starts at offset 19.
+    low, high = (16, 17) if sys.byteorder == 'little' else (17, 16)
+    encoding = sys.getfilesystemencoding()
+    errors = sys.getfilesystemencodeerrors()
+    prefix = os.path.join(path, '')
+    buffer = ctypes.create_string_buffer(buffer_size)
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        while True:
+            count = getdents64(fd, buffer, buffer_size)
+            if count == 0:
+                return
+            data = ctypes.string_at(buffer, count)
+            find = data.find
+            entries = []
+            append = entries.append
+            offset = 0
+            while offset < count:
+                start = offset + 19
+                name = data[start:find(b"\0", start)]
+                if name != b"." and name != b"..":
+                    name = name.decode(encoding, errors)
+                    append(_DirEntry((name, prefix + name, data[offset + 18])))
+                offset += data[offset + low] | data[offset + high] << 8
+            yield from entries
+    finally:
+        os.close(fd)
+
+
+def iter_unbuffered_windows(path: str, chunk_size: int = VERIFY_CHUNK_SIZE):
+    """
+    Yield the contents of a file opened with FILE_FLAG_NO_BUFFERING, so the
+    data comes from the device and not the system file cache (Windows only).
+    chunk_size must be a multiple of UNBUFFERED_ALIGNMENT.
+    """
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = (wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                     wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE)
+    kernel32.ReadFile.argtypes = (wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD,
+                                  ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID)
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    # GENERIC_READ, FILE_SHARE_READ, OPEN_EXISTING, FILE_FLAG_NO_BUFFERING | FILE_FLAG_SEQUENTIAL_SCAN
+    handle = kernel32.CreateFileW(path, 0x80000000, 0x1, None, 3, 0x20000000 | 0x08000000, None)
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        # Unbuffered reads need a sector-aligned buffer address as well as size
+        raw = ctypes.create_string_buffer(chunk_size + UNBUFFERED_ALIGNMENT)
+        address = (ctypes.addressof(raw) + UNBUFFERED_ALIGNMENT - 1) & ~(UNBUFFERED_ALIGNMENT - 1)
+        count = wintypes.DWORD()
+        while True:
+            if not kernel32.ReadFile(handle, address, chunk_size, ctypes.byref(count), None):
+                raise ctypes.WinError(ctypes.get_last_error())
+            if count.value == 0:
+                return
+            yield ctypes.string_at(address, count.value)
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+class _RateLimiter:
+    """Paces callers (across threads) to an average number of bytes per second."""
+    
+    def __init__(self, bytes_per_second: float):
+        import threading
+        self.bytes_per_second = bytes_per_second
+        self._lock = threading.Lock()
+        self._next_free = time.monotonic()
+    
+    def consume(self, size: int, stop=None):
+        """Block until size bytes may be transferred, or until the stop event is set."""
+        if not self.bytes_per_second:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_free)
+            self._next_free = start + size / self.bytes_per_second
+        if start > now:
+            if stop is None:
+                time.sleep(start - now)
+            else:
+                stop.wait(start - now)
+
+
+class LeaseLock:
+    """
+    Advisory lock file with lease expiry, usable across processes and hosts
+    sharing a filesystem. The lock is taken by exclusively creating the file;
+    a holder that has not refreshed it for a whole lease (e.g. a crashed host)
+    is presumed dead and its lock is broken.
+    """
+    
+    def __init__(self, path: str, lease: float = DEFAULT_LOCK_LEASE, timeout: float = None):
+        import socket
+        import uuid
+        self.path = path
+        self.lease = lease
+        self.timeout = lease * 2 if timeout is None else timeout
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self._observed = None
+        self._observed_since = None
+    
+    def _break_if_expired(self) -> bool:
+        """Remove the lock file if its lease ran out; True if it is gone."""
+        # Hosts' clocks may disagree with each other and with the file server,
+        # so mtimes are never compared with local time. A lock is expired once
+        # the same file (inode) has kept the same mtime for a lease measured on
+        # this host's monotonic clock; any refresh or new holder restarts that.
+        try:
+            lock_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        observed = (lock_stat.st_ino, lock_stat.st_mtime_ns)
+        now = time.monotonic()
+        if observed != self._observed:
+            self._observed, self._observed_since = observed, now
+            return False
+        if now - self._observed_since < self.lease:
+            return False
+        
+        # Another waiter may have broken this lock and taken a new one since
+        # the stat: move the file aside, then check it is the one seen stale
+        stale = f"{self.path}.{self.owner.replace(':', '_')}.stale"
+        try:
+            os.rename(self.path, stale)
+        except FileNotFoundError:
+            return True
+        try:
+            stale_stat = os.stat(stale)
+            if (stale_stat.st_ino, stale_stat.st_mtime_ns) != observed:
+                self._restore(stale)
+                return False
+            os.unlink(stale)
+        except FileNotFoundError:
+            pass
+        self._observed = None
+        return True
+    
+    def _restore(self, stale: str):
+        """Put back a live lock file moved aside by mistake."""
+        try:
+            # A hard link never replaces a lock created in the meantime
+            os.link(stale, self.path)
+        except FileExistsError:
+            pass
+        except OSError:
+            os.rename(stale, self.path)
+            return
+        os.unlink(stale)
+    
+    def acquire(self):
+        """
+        Wait for the lock for as long as its holders show signs of life. A
+        refresh (e.g. keep_alive() during a long copy) or a new holder restarts
+        the wait; TimeoutError is raised after self.timeout seconds without one.
+        """
+        started = time.monotonic()
+        delay = 0.005
+        self._observed = None
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if self._break_if_expired():
+                    continue
+                last_change = max(started, self._observed_since or started)
+                if time.monotonic() - last_change >= self.timeout:
+                    raise TimeoutError(f"Timed out waiting for lock {self.path}")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(f"{self.owner}\n")
+            return self
+    
+    def refresh(self):
+        """Extend the lease of a held lock."""
+        os.utime(self.path)
+    
+    def keep_alive(self):
+        """Context manager that refreshes the lease in the background during a long operation."""
+        import contextlib
+        import threading
+        
+        @contextlib.contextmanager
+        def refreshing():
+            stop = threading.Event()
+            
+            def heartbeat():
+                while not stop.wait(self.lease / 3):
+                    try:
+                        self.refresh()
+                    except OSError:
+                        return
+            
+            thread = threading.Thread(target=heartbeat, daemon=True)
+            thread.start()
+            try:
+                yield self
+            finally:
+                stop.set()
+                thread.join()
+        
+        return refreshing()
+    
+    def release(self):
+        """Remove the lock file if it is still ours."""
+        try:
+            with open(self.path) as f:
+                if f.read().strip() != self.owner:
+                    return
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+    
+    def __enter__(self):
+        return self.acquire()
+    
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse an "i/N" shard spec (0 <= i < N)."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got '{value}'")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard index must be between 0 and N-1, got '{value}'")
+    return index, count
+
+
+class IgnoreRules:
+    """
+    Compiled gitignore-style exclusion rules.
+    
+    Supports comments, "!" negation (the last matching rule wins), trailing
+    "/" for directory-only rules, anchoring with a leading or inner "/", and
+    the "*", "?", "[...]" and "**" wildcards. Paths are relative to the
+    directory holding the rules and use "/" as separator. As with git, a file
+    inside an ignored directory cannot be re-included.
+    """
+    
+    def __init__(self, patterns):
+        import re
+        
+        # (regex, negate, dir_only) in file order
+        self.rules = []
+        for line in patterns:
+            rule = self._compile(line.rstrip('\r\n'))
+            if rule is not None:
+                self.rules.append(rule)
+        
+        # One combined pattern per entry kind: names matching no rule at all
+        # (the common case) are accepted with a single regex call
+        file_rules = [rule[0].pattern for rule in self.rules if not rule[2]]
+        all_rules = [rule[0].pattern for rule in self.rules]
+        self._any_file_rule = re.compile("|".join(file_rules)) if file_rules else None
+        self._any_rule = re.compile("|".join(all_rules)) if all_rules else None
+    
+    @classmethod
+    def from_file(cls, ignore_file: str, defaults=DEFAULT_IGNORE_PATTERNS) -> IgnoreRules:
+        """Load rules from an ignore file, after the default patterns."""
+        with open(ignore_file, encoding='utf-8') as f:
+            return cls(list(defaults) + f.read().splitlines())
+    
+    @staticmethod
+    def _glob_to_regex(pattern: str) -> str:
+        """Translate a gitignore glob into a regex fragment."""
+        import re
+        
+        parts = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith('**/', i):
+                parts.append('(?:.*/)?')  # zero or more directories
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                parts.append('.*')
+                i += 2
+                continue
+            if char == '*':
+                parts.append('[^/]*')
+            elif char == '?':
+                parts.append('[^/]')
+            elif char == '[':
+                end = pattern.find(']', i + 2 if pattern[i + 1:i + 2] in ('!', ']') else i + 1)
+                if end == -1:
+                    parts.append(re.escape(char))
+                else:
+                    body = pattern[i + 1:end].replace('\\', '\\\\')
+                    if body.startswith('!'):
+                        body = '^' + body[1:]
+                    parts.append(f'(?!/)[{body}]')
+                    i = end
+            elif char == '\\' and i + 1 < len(pattern):
+                i += 1
+                parts.append(re.escape(pattern[i]))
+            else:
+                parts.append(re.escape(char))
+            i += 1
+        return ''.join(parts)
+    
+    def _compile(self, line: str):
+        """Compile one ignore file line into (regex, negate, dir_only), or None."""
+        import re
+        
+        if line.endswith(' ') and not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            return None
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith(('\\!', '\\#')):
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return None
+        # Patterns containing a slash are relative to the root; others match at any depth
+        anchored = '/' in line
+        regex = self._glob_to_regex(line.lstrip('/'))
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        return re.compile(f'(?:{regex})$'), negate, dir_only
+    
+    def _match(self, rel_path: str, is_dir: bool) -> bool:
+        """Apply the rules to a single path, ignoring its parents."""
+        combined = self._any_rule if is_dir else self._any_file_rule
+        if combined is None or not combined.match(rel_path):
+            return False
+        for regex, negate, dir_only in reversed(self.rules):
+            if (is_dir or not dir_only) and regex.match(rel_path):
+                return not negate
+        return False
+    
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Check a path, pruning at the first ignored parent directory."""
+        parts = rel_path.replace('\\', '/').strip('/').split('/')
+        for depth in range(1, len(parts)):
+            if self._match('/'.join(parts[:depth]), True):
+                return True
+        return self._match('/'.join(parts), is_dir)
+    
+    def ignored_names(self, names: list[str], is_dir: bool = False) -> set[str]:
+        """Return the subset of entry names (in one directory) that are ignored."""
+        combined = self._any_rule if is_dir else self._any_file_rule
+        if combined is None:
+            return set()
+        return {name for name in names if combined.match(name) and self._match(name, is_dir)}
 
 
 class DesktopOrganizer:
     """Desktop file organizer with comprehensive functionality."""
     
-    def __init__(self, target_dir: str = None, dry_run: bool = False, enable_logging: bool = True):
+    def __init__(self, target_dir: str = None, dry_run: bool = False, enable_logging: bool = True,
+                 layout: str = "flat", verify: str = None, ignore_file: str = None,
+                 history_db: str = None, shard: tuple[int, int] = None,
+                 lock_lease: float = DEFAULT_LOCK_LEASE, cold_root: str = None,
+                 cold_after_days: float = None, cold_workers: int = DEFAULT_COLD_WORKERS,
+                 cold_rate_limit: float = 0, reader: str = "scandir",
+                 getdents_buffer: int = DEFAULT_GETDENTS_BUFFER):
         """
         Initialize the organizer.
         
@@ -37,11 +621,38 @@ class DesktopOrganizer:
             target_dir: Directory to organize (default: Desktop)
             dry_run: If True, only simulate actions without moving files
             enable_logging: If True, create detailed logs
+            layout: Destination layout inside each category folder (see LAYOUTS)
+            verify: Checksum cross-device moves and check the copy (see VERIFY_MODES)
+            ignore_file: Gitignore-style exclusion file (default: <target>/.organizerignore)
+            history_db: SQLite run history to append to (default: organizer_logs/history.sqlite3
+                        when file logging is enabled, otherwise no history is kept)
+            shard: (i, N) to handle only the i-th of N partitions, cooperating with
+                   other instances on the same directory through lock files
+            lock_lease: Seconds after which a lock held by a vanished instance is broken
+            cold_root: Directory for the cold tier (e.g. on a slower, larger volume)
+            cold_after_days: Move files not accessed or modified for this many days to cold_root
+            cold_workers: Number of cold tier migrations run concurrently
+            cold_rate_limit: Cap on cold tier migration throughput in bytes/second (0: unlimited)
+            reader: Directory reader for the scan ("scandir" or "getdents"; the
+                latter falls back to scandir where getdents64 is unavailable)
+            getdents_buffer: Bytes of directory records fetched per getdents64 call
         """
+        if reader not in READERS:
+            raise ValueError(f"Unknown reader '{reader}' (expected one of: {', '.join(READERS)})")
+        if getdents_buffer < MIN_GETDENTS_BUFFER:
+            raise ValueError(f"getdents_buffer must be at least {MIN_GETDENTS_BUFFER} bytes")
+        if (cold_root is None) != (cold_after_days is None):
+            raise ValueError("cold_root and cold_after_days must be given together")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}' (expected one of: {', '.join(LAYOUTS)})")
+        if verify is not None and verify not in VERIFY_MODES:
+            raise ValueError(f"Unknown verify mode '{verify}' (expected one of: {', '.join(VERIFY_MODES)})")
+        
         # Windows-optimized path handling
         if target_dir:
             self.target_dir = target_dir
         else:
+            import platform
             if platform.system() == "Windows":
                 # Use Windows-specific path for maximum compatibility
                 self.target_dir = os.path.join(os.environ.get('USERPROFILE', os.path.expanduser("~")), "Desktop")
@@ -51,6 +662,39 @@ class DesktopOrganizer:
                 
         self.dry_run = dry_run
         self.enable_logging = enable_logging
+        self.layout = layout
+        self.verify = verify
+        self._cached_readback_warned = False
+        self.view_mode = None
+        self.ignore_file = ignore_file or os.path.join(self.target_dir, IGNORE_FILE_NAME)
+        self._ignore_rules = None
+        self._ignore_rules_key = None
+        if history_db is None and enable_logging:
+            history_db = os.path.join(self.target_dir, "organizer_logs", HISTORY_DB_NAME)
+        self.history_db = history_db
+        if shard is not None:
+            index, count = shard
+            if count < 1 or not 0 <= index < count:
+                raise ValueError(f"Invalid shard {index}/{count}")
+        self.shard = shard
+        self.lock_lease = lock_lease
+        self.cold_root = os.path.abspath(cold_root) if cold_root else None
+        self.cold_after_days = cold_after_days
+        self.cold_workers = max(1, cold_workers)
+        self.cold_rate_limit = cold_rate_limit
+        self._cold_cutoff = None
+        self._stats_lock = None
+        self.reader = reader
+        self.getdents_buffer = getdents_buffer
+        self._getdents64 = None
+        self.phase_times = {}
+        self.bytes_moved = 0
+        self._phase_name = None
+        self._phase_start = None
+        self._run_started = None
+        self._run_file_count = 0
+        self.digests = []
+        self._stat_cache = {}
         self.stats = {
             'files_moved': 0,
             'files_skipped': 0,
@@ -62,79 +706,17 @@ class DesktopOrganizer:
         if self.enable_logging:
             self._setup_logging()
         else:
-            # Create a simple logger that doesn't write to file
-            self.logger = logging.getLogger('desktop_organizer')
-            self.logger.setLevel(logging.INFO)
-            if not self.logger.handlers:
-                handler = logging.StreamHandler()
-                formatter = logging.Formatter('%(message)s')
-                handler.setFormatter(formatter)
-                self.logger.addHandler(handler)
-        
-        # Comprehensive file type mapping - Windows-optimized
-        self.file_types = {
-            # Images
-            "jpg": "images", "jpeg": "images", "png": "images", "gif": "images",
-            "bmp": "images", "tiff": "images", "tif": "images", "svg": "images",
-            "webp": "images", "ico": "images", "raw": "images", "psd": "images",
-            
-            # Videos
-            "mp4": "videos", "avi": "videos", "mkv": "videos", "mov": "videos",
-            "wmv": "videos", "flv": "videos", "webm": "videos", "m4v": "videos",
-            "3gp": "videos", "mpg": "videos", "mpeg": "videos", "ogv": "videos",
-            
-            # Audio
-            "mp3": "audio", "wav": "audio", "flac": "audio", "aac": "audio",
-            "ogg": "audio", "wma": "audio", "m4a": "audio", "opus": "audio",
-            "aiff": "audio", "amr": "audio",
-            
-            # Documents
-            "doc": "documents", "docx": "documents", "pdf": "documents",
-            "txt": "documents", "rtf": "documents", "odt": "documents",
-            "pages": "documents", "tex": "documents",
-            
-            # Spreadsheets
-            "xls": "spreadsheets", "xlsx": "spreadsheets", "csv": "spreadsheets",
-            "ods": "spreadsheets", "numbers": "spreadsheets",
-            
-            # Presentations
-            "ppt": "presentations", "pptx": "presentations", "odp": "presentations",
-            "key": "presentations",
-            
-            # Code files
-            "py": "code", "js": "code", "html": "code", "css": "code",
-            "java": "code", "cpp": "code", "c": "code", "h": "code",
-            "php": "code", "rb": "code", "go": "code", "rs": "code",
-            "swift": "code", "kt": "code", "scala": "code", "pl": "code",
-            "sh": "code", "bat": "code", "cmd": "code", "ps1": "code",
-            "json": "code", "xml": "code", "yaml": "code", "yml": "code",
-            "sql": "code", "md": "code", "ini": "code", "cfg": "code",
-            
-            # Applications
-            "exe": "applications", "msi": "applications", "deb": "applications",
-            "rpm": "applications", "dmg": "applications", "pkg": "applications",
-            "app": "applications", "apk": "applications",
-            
-            # Archives
-            "zip": "archives", "rar": "archives", "7z": "archives",
-            "tar": "archives", "gz": "archives", "xz": "archives",
-            "bz2": "archives", "tgz": "archives", "tbz2": "archives",
-            "z": "archives", "lz": "archives", "lzma": "archives",
-            
-            # Fonts
-            "ttf": "fonts", "otf": "fonts", "woff": "fonts", "woff2": "fonts",
-            "eot": "fonts", "fon": "fonts",
-            
-            # E-books
-            "epub": "ebooks", "mobi": "ebooks", "azw": "ebooks", "azw3": "ebooks",
-            "fb2": "ebooks", "lit": "ebooks",
-            
-            # Shortcuts
-            "lnk": "shortcuts", "url": "shortcuts", "desktop": "shortcuts",
-        }
+            # Console-only output; avoids importing logging and creating a log directory
+            self.logger = _ConsoleLogger()
+        self._ansi_enabled = None
+        
+        self.file_types = FILE_TYPES
     
     def _setup_logging(self):
         """Setup logging to file and console."""
+        import logging
+        from datetime import datetime
+        
         # Create logs directory if it doesn't exist
         log_dir = os.path.join(self.target_dir, "organizer_logs")
         os.makedirs(log_dir, exist_ok=True)
@@ -159,12 +741,33 @@ class DesktopOrganizer:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
     
+    def _enable_ansi(self) -> bool:
+        """Enable ANSI escape handling on the Windows console (no-op elsewhere)."""
+        import platform
+        if platform.system() != "Windows":
+            return True
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING (Windows 10 and later)
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except (AttributeError, OSError):
+            return False
+    
     def clear_screen(self):
-        """Clear the console screen (Windows-optimized)"""
-        if platform.system() == "Windows":
-            os.system('cls')
+        """Clear the console screen with ANSI escapes instead of spawning cls/clear."""
+        if self._ansi_enabled is None:
+            self._ansi_enabled = self._enable_ansi()
+        if self._ansi_enabled:
+            sys.stdout.write(ANSI_CLEAR_SCREEN)
+            sys.stdout.flush()
         else:
-            os.system('clear')
+            # Legacy Windows consoles without virtual terminal support
+            os.system('cls')
     
     def show_menu(self):
         """Display the interactive menu"""
@@ -193,69 +796,453 @@ class DesktopOrganizer:
                 print("\nOperation cancelled by user.")
                 return 4
     
+    def _count(self, key: str, amount: int = 1):
+        """Increment a statistic (thread-safe while cold tier workers run)."""
+        if self._stats_lock is None:
+            self.stats[key] += amount
+        else:
+            with self._stats_lock:
+                self.stats[key] += amount
+    
+    def _display_path(self, path: str) -> str:
+        """Path relative to the target directory, or absolute when outside it."""
+        absolute = os.path.abspath(path)
+        root = os.path.abspath(self.target_dir)
+        if os.path.commonpath([absolute, root]) == root:
+            return os.path.relpath(absolute, root)
+        return absolute
+    
     def _create_folder_if_not_exists(self, folder_path: str) -> bool:
         """Create folder if it doesn't exist."""
         if not os.path.exists(folder_path):
             if not self.dry_run:
                 try:
-                    os.makedirs(folder_path)
-                    self.logger.info(f"Created folder: {os.path.basename(folder_path)}")
-                    self.stats['folders_created'] += 1
+                    os.makedirs(folder_path, exist_ok=True)
+                    self.logger.info(f"Created folder: {self._display_path(folder_path)}")
+                    self._count('folders_created')
                     return True
                 except OSError as e:
                     self.logger.error(f"Failed to create folder {folder_path}: {e}")
-                    self.stats['errors'] += 1
+                    self._count('errors')
                     return False
             else:
-                self.logger.info(f"[DRY RUN] Would create folder: {os.path.basename(folder_path)}")
-                self.stats['folders_created'] += 1
+                self.logger.info(f"[DRY RUN] Would create folder: {self._display_path(folder_path)}")
+                self._count('folders_created')
                 return True
         return False
     
     def _move_file(self, source: str, destination: str) -> bool:
         """Move file from source to destination."""
         if os.path.exists(destination):
-            self.logger.warning(f"Skipped: {os.path.basename(source)} (already exists in {os.path.basename(os.path.dirname(destination))})")
-            self.stats['files_skipped'] += 1
-            return False
+            return self._skip_collision(source, destination)
         
         if not self.dry_run:
             try:
-                shutil.move(source, destination)
+                if self.shard is not None:
+                    if not self._move_cooperative(source, destination):
+                        return False
+                elif not self._transfer(source, destination):
+                    return False
                 self.logger.info(f"Moved: {os.path.basename(source)} -> {os.path.basename(os.path.dirname(destination))}")
-                self.stats['files_moved'] += 1
+                self._count('files_moved')
                 return True
-            except (OSError, shutil.Error) as e:
+            except OSError as e:  # includes shutil.Error
                 self.logger.error(f"Failed to move {os.path.basename(source)}: {e}")
-                self.stats['errors'] += 1
+                self._count('errors')
                 return False
         else:
             self.logger.info(f"[DRY RUN] Would move: {os.path.basename(source)} -> {os.path.basename(os.path.dirname(destination))}")
-            self.stats['files_moved'] += 1
+            self._count('files_moved')
+            return True
+    
+    def _transfer(self, source: str, destination: str) -> bool:
+        """Move a file, verifying cross-device copies when requested."""
+        if self.verify and self._is_cross_device(source, destination):
+            return self._move_verified(source, destination)
+        try:
+            os.rename(source, destination)
+        except OSError:
+            # Other device (EXDEV) or a rename the filesystem refuses: shutil
+            # retries the rename and falls back to copy and delete
+            import shutil
+            shutil.move(source, destination)
+        return True
+    
+    def _lock(self, name: str) -> LeaseLock:
+        """Advisory lock shared by all instances working on the target directory."""
+        lock_dir = os.path.join(self.target_dir, LOCK_DIR_NAME)
+        os.makedirs(lock_dir, exist_ok=True)
+        return LeaseLock(os.path.join(lock_dir, f"{name}.lock"), lease=self.lock_lease)
+    
+    def _move_cooperative(self, source: str, destination: str) -> bool:
+        """
+        Move a file without ever replacing one placed concurrently by another
+        instance. A hard link claims the destination name atomically; where
+        links are not possible (other device, FAT, some SMB shares) the
+        existence check and move are done under the category lock instead.
+        """
+        try:
+            os.link(source, destination)
+        except FileExistsError:
+            return self._skip_collision(source, destination)
+        except FileNotFoundError:
+            return self._skip_vanished(source)
+        except OSError:
+            category_lock = self._lock(f"category-{self._category_of(destination)}")
+            # A cross-device copy can outlast the lease: refresh it meanwhile
+            with category_lock, category_lock.keep_alive():
+                if os.path.exists(destination):
+                    return self._skip_collision(source, destination)
+                if not os.path.exists(source):
+                    return self._skip_vanished(source)
+                return self._transfer(source, destination)
+        os.unlink(source)
+        return True
+    
+    def _category_of(self, destination: str) -> str:
+        """Category folder of a planned destination, in the target or the cold tier."""
+        root = self.cold_root if self._is_cold_destination(destination) else self.target_dir
+        return os.path.relpath(destination, root).split(os.sep)[0]
+    
+    def _skip_collision(self, source: str, destination: str) -> bool:
+        """Count and log a file skipped because its destination is taken."""
+        self.logger.warning(f"Skipped: {os.path.basename(source)} (already exists in {os.path.basename(os.path.dirname(destination))})")
+        self._count('files_skipped')
+        return False
+    
+    def _skip_vanished(self, source: str) -> bool:
+        """Count and log a file that another instance already moved."""
+        self.logger.warning(f"Skipped: {os.path.basename(source)} (moved by another instance)")
+        self._count('files_skipped')
+        return False
+    
+    def _in_shard(self, name: str) -> bool:
+        """Stable partition of files between cooperating instances."""
+        import zlib
+        index, count = self.shard
+        return zlib.crc32(name.encode('utf-8', 'surrogateescape')) % count == index
+    
+    def _is_cross_device(self, source: str, destination: str) -> bool:
+        """Check whether a move would have to copy the data to another device."""
+        destination_device = os.stat(os.path.dirname(destination)).st_dev
+        return self._get_file_stat(source).st_dev != destination_device
+    
+    def _move_verified(self, source: str, destination: str) -> bool:
+        """
+        Copy a file across devices while hashing it, check the copy and only
+        then remove the source. The digest is recorded for the run's report.
+        """
+        import hashlib
+        import shutil
+        
+        digest = hashlib.sha256()
+        with open(source, 'rb') as src:
+            try:
+                dst = open(destination, 'xb')
+            except FileExistsError:
+                # Appeared since the check in _move_file: not ours to touch
+                return self._skip_collision(source, destination)
+            
+            # From here on the destination is the copy this call created
+            try:
+                # Hash while streaming so the source is read exactly once
+                with dst:
+                    for chunk in iter(lambda: src.read(VERIFY_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+                        dst.write(chunk)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                shutil.copystat(source, destination)
+                verified = self._verify_copy(source, destination, digest.hexdigest())
+            except OSError:
+                self._remove_partial_copy(destination)
+                raise
+        
+        if not verified:
+            self._remove_partial_copy(destination)
+            self.logger.error(f"Verification failed for {os.path.basename(source)}; source kept")
+            self._count('errors')
+            return False
+        
+        os.unlink(source)
+        self.digests.append((digest.hexdigest(), destination))
+        return True
+    
+    def _verify_copy(self, source: str, destination: str, digest: str) -> bool:
+        """Check a copied file against its source according to the verify mode."""
+        if os.stat(destination).st_size != os.stat(source).st_size:
+            return False
+        if self.verify == "metadata":
+            # Size only: copystat gave the copy the source's mtime, so it always matches
             return True
+        return self._read_back_digest(destination) == digest
+    
+    def _read_back_digest(self, path: str) -> str:
+        """SHA-256 of a file as read back from the device, bypassing the OS cache where possible."""
+        import hashlib
+        
+        readback = hashlib.sha256()
+        if os.name == 'nt':
+            for chunk in iter_unbuffered_windows(path):
+                readback.update(chunk)
+            return readback.hexdigest()
+        
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                # Drop the freshly written pages so the read-back hits the device
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            elif not self._cached_readback_warned:
+                self._cached_readback_warned = True
+                self.logger.warning("The OS cache cannot be dropped on this platform: "
+                                    "--verify readback re-hashes copies that may come from the cache")
+            for chunk in iter(lambda: f.read(VERIFY_CHUNK_SIZE), b''):
+                readback.update(chunk)
+        return readback.hexdigest()
+    
+    def _remove_partial_copy(self, destination: str):
+        """Remove an incomplete or unverified copy, ignoring errors."""
+        try:
+            os.unlink(destination)
+        except OSError:
+            pass
+    
+    def _write_digest_report(self):
+        """Write the digests of verified moves in sha256sum format."""
+        log_dir = os.path.join(self.target_dir, "organizer_logs")
+        report_file = os.path.join(log_dir, f"digests_{time.strftime('%Y%m%d_%H%M%S')}.sha256")
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            with open(report_file, 'w', encoding='utf-8') as f:
+                for digest, destination in self.digests:
+                    f.write(f"{digest}  {destination}\n")
+            self.logger.info(f"Checksums of {len(self.digests)} verified files written to: {report_file}")
+        except OSError as e:
+            self.logger.error(f"Failed to write checksum report {report_file}: {e}")
+            self._count('errors')
     
     def _get_file_extension(self, file_path: str) -> str:
         """Get file extension in lowercase (Windows case-insensitive)."""
         return os.path.splitext(file_path)[1][1:].lower()
     
-    def _get_files_to_organize(self) -> List[str]:
+    def _get_file_stat(self, file_path: str) -> os.stat_result:
+        """Return the stat result for a file, caching it for the rest of the run."""
+        file_stat = self._stat_cache.get(file_path)
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+            self._stat_cache[file_path] = file_stat
+        return file_stat
+    
+    def _get_category(self, file_path: str) -> str:
+        """Get the category folder name for a file ("other" for unknown types)."""
+        return self.file_types.get(self._get_file_extension(file_path), "other")
+    
+    def _get_destination_folder(self, category: str, file_path: str, root: str = None) -> str:
+        """Get the destination folder for a file according to the layout."""
+        category_folder = os.path.join(root or self.target_dir, category)
+        if self.layout == "date":
+            modified = time.localtime(self._get_file_stat(file_path).st_mtime)
+            return os.path.join(category_folder, f"{modified.tm_year:04d}", f"{modified.tm_mon:02d}")
+        if self.layout == "hash":
+            import hashlib
+            file_name = os.path.basename(file_path)
+            digest = hashlib.md5(file_name.encode('utf-8', 'surrogateescape')).hexdigest()
+            return os.path.join(category_folder, digest[:2])
+        return category_folder
+    
+    def _is_cold(self, file_path: str) -> bool:
+        """Check whether a file has been neither read nor modified within the cold tier threshold."""
+        if self._cold_cutoff is None:
+            return False
+        file_stat = self._get_file_stat(file_path)
+        return max(file_stat.st_atime, file_stat.st_mtime) < self._cold_cutoff
+    
+    def _is_cold_destination(self, destination: str) -> bool:
+        """Check whether a planned destination is in the cold tier."""
+        return bool(self.cold_root) and destination.startswith(os.path.join(self.cold_root, ''))
+    
+    def _get_cold_sorted_files(self) -> dict[str, list[tuple[str, str]]]:
+        """
+        Find files already sorted into category folders (by earlier runs) that
+        have gone cold, mapped to the same relative path under the cold root.
+        The ignore rules apply to paths relative to the target directory, and
+        an ignored folder is not descended into.
+        """
+        rules = self._get_ignore_rules()
+        cold_moves = {}
+        for category in sorted(set(self.file_types.values()) | {"other"}):
+            if rules is not None and rules.is_ignored(category, is_dir=True):
+                continue
+            folders = [os.path.join(self.target_dir, category)]
+            while folders:
+                folder = folders.pop()
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            relative = os.path.relpath(entry.path, self.target_dir)
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            if rules is None:
+                                if entry.name.startswith('.'):
+                                    continue
+                            elif rules.is_ignored(relative, is_dir):
+                                continue
+                            if is_dir:
+                                folders.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False) or (
+                                    self.shard is not None and not self._in_shard(relative)):
+                                continue
+                            self._stat_cache[entry.path] = entry.stat()
+                            if self._is_cold(entry.path):
+                                destination = os.path.join(self.cold_root, relative)
+                                cold_moves.setdefault(category, []).append((entry.path, destination))
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    self.logger.error(f"Failed to scan {folder} for the cold tier: {e}")
+                    self._count('errors')
+        return cold_moves
+    
+    def _plan_moves(self, files_by_category: dict[str, list[str]]) -> dict[str, list[tuple[str, str]]]:
+        """Map every file to its destination path, grouped by category."""
+        planned_moves = {}
+        for category, files in files_by_category.items():
+            moves = []
+            for file_path in files:
+                try:
+                    root = self.cold_root if self._is_cold(file_path) else None
+                    destination_folder = self._get_destination_folder(category, file_path, root=root)
+                except OSError as e:
+                    self.logger.error(f"Failed to read {os.path.basename(file_path)}: {e}")
+                    self._count('errors')
+                    continue
+                moves.append((file_path, os.path.join(destination_folder, os.path.basename(file_path))))
+            planned_moves[category] = moves
+        return planned_moves
+    
+    def _get_ignore_rules(self) -> IgnoreRules:
+        """
+        Load the ignore file, reusing the compiled rules while it is unchanged.
+        Returns None when there is no ignore file (only hidden files are skipped).
+        """
+        try:
+            ignore_stat = os.stat(self.ignore_file)
+        except OSError:
+            self._ignore_rules, self._ignore_rules_key = None, None
+            return None
+        
+        key = (ignore_stat.st_mtime_ns, ignore_stat.st_size)
+        if key != self._ignore_rules_key:
+            try:
+                self._ignore_rules = IgnoreRules.from_file(self.ignore_file)
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.error(f"Failed to read ignore file {self.ignore_file}: {e}")
+                self._ignore_rules = IgnoreRules(DEFAULT_IGNORE_PATTERNS)
+            self._ignore_rules_key = key
+        return self._ignore_rules
+    
+    def _filter_entries(self, entries: list, rules: IgnoreRules, scanned):
+        """Yield the paths of the non-ignored regular files among a batch of entries."""
+        ignored = rules.ignored_names([entry.name for entry in entries])
+        for entry in entries:
+            # Uses the directory entry type where the OS provides it (no stat)
+            if entry.name not in ignored and entry.is_file():
+                yield scanned(entry)
+    
+    def _iter_files_to_organize(self, cache_stats: bool = True):
+        """
+        Yield files to organize, excluding directories and ignored files.
+        Without cache_stats the entries are never stat'ed, whatever the layout.
+        """
+        scanned = self._scanned if cache_stats else (lambda entry: entry.path)
+        rules = self._get_ignore_rules()
+        entries = self._scan_target()
+        if rules is None:
+            # No ignore file: only hidden files are skipped, without compiling any rules
+            for entry in entries:
+                if not entry.name.startswith('.') and entry.is_file():
+                    yield scanned(entry)
+            return
+        
+        # Match names in batches before any entry type lookup or stat
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= IGNORE_BATCH_SIZE:
+                yield from self._filter_entries(batch, rules, scanned)
+                batch = []
+        yield from self._filter_entries(batch, rules, scanned)
+    
+    def _scanned(self, entry) -> str:
+        """Path of a scanned file, caching its stat when planning will need it."""
+        if self._cold_cutoff is not None or self.layout == "date":
+            # Served from the directory listing on Windows, one stat elsewhere
+            try:
+                self._stat_cache[entry.path] = entry.stat()
+            except OSError:
+                pass
+        return entry.path
+    
+    def _scan_target(self):
+        """Yield the entries of the target directory with the configured reader."""
+        if self.reader == "getdents":
+            if self._getdents64 is None:
+                self._getdents64 = load_getdents64() or False
+                if not self._getdents64:
+                    self.logger.warning("getdents64 is not available on this platform, using scandir")
+            if self._getdents64:
+                yield from iter_getdents(self.target_dir, self.getdents_buffer, self._getdents64)
+                return
+        with os.scandir(self.target_dir) as entries:
+            yield from entries
+    
+    def _get_files_to_organize(self) -> list[str]:
         """Get list of files to organize, excluding directories and system files."""
         try:
-            all_files = glob.glob(os.path.join(self.target_dir, "*"))
-            # Filter out directories, hidden files, and log folder
-            files_to_organize = [
-                f for f in all_files 
-                if os.path.isfile(f) 
-                and not os.path.basename(f).startswith('.') 
-                and 'organizer_logs' not in f
-            ]
-            return files_to_organize
+            files = self._iter_files_to_organize()
+            if self.shard is not None:
+                # Partition by path relative to the target directory
+                return [f for f in files if self._in_shard(os.path.relpath(f, self.target_dir))]
+            return list(files)
         except OSError as e:
             self.logger.error(f"Failed to get files from {self.target_dir}: {e}")
             return []
     
-    def organize_files(self) -> Dict[str, int]:
+    def organize_files(self) -> dict[str, int]:
         """Organize files in the target directory."""
+        planned_moves = self._prepare_run()
+        if planned_moves is None:
+            return self.stats
+        
+        self._start_phase("move")
+        cold_moves = []
+        for category, moves in planned_moves.items():
+            if category == "other":
+                self.logger.info("Organizing unknown file types...")
+            else:
+                self.logger.info(f"Organizing {category} files...")
+            
+            for file_path, destination in moves:
+                if self._is_cold_destination(destination):
+                    cold_moves.append((file_path, destination))
+                    continue
+                size = self._get_size_for_history(file_path)
+                if self._move_file(file_path, destination):
+                    self.bytes_moved += size
+        
+        if cold_moves:
+            self._start_phase("cold")
+            self._migrate_cold(cold_moves)
+        
+        self._finish_run()
+        return self.stats
+    
+    def _prepare_run(self) -> dict[str, list[tuple[str, str]]] | None:
+        """
+        Reset the run state, then scan, plan and create the destination folders.
+        
+        Returns:
+            Planned moves by category, or None when there is nothing to move
+        """
         self.logger.info(f"Starting file organization in: {self.target_dir}")
         self.logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'EXECUTE'}")
         self.logger.info("-" * 50)
@@ -263,11 +1250,13 @@ class DesktopOrganizer:
         # Validate target directory
         if not os.path.exists(self.target_dir):
             error_msg = f"Target directory does not exist: {self.target_dir}"
+            import platform
             if platform.system() == "Windows":
                 error_msg += f"\nMake sure you have a Desktop folder in your user profile."
-                error_msg += f"\nExpected location: {os.environ.get('USERPROFILE', 'C:\\Users\\YourName')}\\Desktop"
+                user_profile = os.environ.get('USERPROFILE', 'C:\\Users\\YourName')
+                error_msg += f"\nExpected location: {user_profile}\\Desktop"
             self.logger.error(error_msg)
-            return self.stats
+            return None
         
         # Reset stats
         self.stats = {
@@ -276,14 +1265,29 @@ class DesktopOrganizer:
             'folders_created': 0,
             'errors': 0
         }
+        self.digests = []
+        self.bytes_moved = 0
+        self._stat_cache = {}
+        self.phase_times = {}
+        self._run_started = time.time()
+        if self.cold_root:
+            self._cold_cutoff = self._run_started - self.cold_after_days * 86400
         
+        self._start_phase("scan")
         files_to_organize = self._get_files_to_organize()
+        cold_sorted = self._get_cold_sorted_files() if self._cold_cutoff is not None else {}
+        cold_sorted_count = sum(len(moves) for moves in cold_sorted.values())
+        self._run_file_count = len(files_to_organize) + cold_sorted_count
         self.logger.info(f"Found {len(files_to_organize)} files to organize")
+        if cold_sorted_count:
+            self.logger.info(f"Found {cold_sorted_count} sorted files for the cold tier")
         
-        if not files_to_organize:
+        if not files_to_organize and not cold_sorted:
+            self._start_phase(None)
             self.logger.info("No files found to organize.")
-            return self.stats
+            return None
         
+        self._start_phase("plan")
         # Group files by extension
         files_by_extension = {}
         unknown_files = []
@@ -299,30 +1303,554 @@ class DesktopOrganizer:
             else:
                 unknown_files.append(file_path)
         
-        # Organize known file types
-        for category, files in files_by_extension.items():
-            self.logger.info(f"Organizing {category} files...")
-            category_folder = os.path.join(self.target_dir, category)
-            self._create_folder_if_not_exists(category_folder)
-            
-            for file_path in files:
-                file_name = os.path.basename(file_path)
-                destination = os.path.join(category_folder, file_name)
-                self._move_file(file_path, destination)
-        
-        # Handle unknown file types
+        # Unknown file types go last, into "other"
         if unknown_files:
-            self.logger.info("Organizing unknown file types...")
-            other_folder = os.path.join(self.target_dir, "other")
-            self._create_folder_if_not_exists(other_folder)
-            
-            for file_path in unknown_files:
-                file_name = os.path.basename(file_path)
-                destination = os.path.join(other_folder, file_name)
-                self._move_file(file_path, destination)
+            files_by_extension["other"] = unknown_files
+        
+        planned_moves = self._plan_moves(files_by_extension)
+        for category, moves in cold_sorted.items():
+            planned_moves.setdefault(category, []).extend(moves)
+        
+        # Create every destination folder in one batch before moving anything
+        self._start_phase("folders")
+        destination_folders = sorted({
+            os.path.dirname(destination)
+            for moves in planned_moves.values()
+            for _, destination in moves
+        })
+        if self.shard is not None and not self.dry_run:
+            try:
+                with self._lock("root") as root_lock:
+                    for i, folder in enumerate(destination_folders, 1):
+                        self._create_folder_if_not_exists(folder)
+                        if i % 256 == 0:
+                            root_lock.refresh()
+            except OSError as e:
+                self.logger.error(f"Failed to lock {self.target_dir}: {e}")
+                self._count('errors')
+        else:
+            for folder in destination_folders:
+                self._create_folder_if_not_exists(folder)
+        return planned_moves
+    
+    def _finish_run(self):
+        """Write the reports, print the summary and record the run in the history."""
+        self._start_phase("report")
+        if self.digests:
+            self._write_digest_report()
         
         self._print_summary()
-        return self.stats
+        self._start_phase(None)
+        if self.history_db:
+            self._record_run(self._run_started, self._run_file_count)
+        self._stat_cache = {}  # do not hold a stat per file until the next run
+    
+    def _migrate_cold(self, moves: list[tuple[str, str]], stop=None):
+        """
+        Move untouched files to the cold tier on a bounded pool of workers,
+        throttled to cold_rate_limit, and record each one in the cold index.
+        
+        Once the optional stop event (a threading.Event) is set, files not yet
+        started are left in place; the call returns after the running moves.
+        """
+        import json
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.logger.info(f"Migrating {len(moves)} untouched files to cold tier: {self.cold_root}")
+        limiter = _RateLimiter(self.cold_rate_limit)
+        index_lock = threading.Lock()
+        index_file = os.path.join(self.target_dir, COLD_INDEX_NAME)
+        
+        def migrate(source: str, destination: str):
+            if stop is not None and stop.is_set():
+                return
+            try:
+                file_stat = self._get_file_stat(source)
+            except OSError as e:
+                self.logger.error(f"Failed to read {os.path.basename(source)}: {e}")
+                self._count('errors')
+                return
+            limiter.consume(file_stat.st_size, stop)
+            if stop is not None and stop.is_set():
+                return
+            if not self._move_file(source, destination) or self.dry_run:
+                return
+            with self._stats_lock:
+                self.bytes_moved += file_stat.st_size
+            entry = {
+                'name': os.path.basename(source),
+                'source': os.path.abspath(source),
+                'destination': destination,
+                'size': file_stat.st_size,
+                'atime': file_stat.st_atime,
+                'mtime': file_stat.st_mtime,
+                'migrated': time.time(),
+            }
+            try:
+                with index_lock, open(index_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                self.logger.error(f"Failed to update cold index {index_file}: {e}")
+                self._count('errors')
+        
+        self._stats_lock = threading.Lock()
+        try:
+            with ThreadPoolExecutor(max_workers=self.cold_workers) as pool:
+                futures = [pool.submit(migrate, source, destination) for source, destination in moves]
+                for future in futures:
+                    # Re-raise anything unexpected (OSErrors are handled in migrate)
+                    future.result()
+        finally:
+            self._stats_lock = None
+    
+    def _start_phase(self, name: str):
+        """Close the running phase (recording its duration) and start the next one."""
+        now = time.perf_counter()
+        if self._phase_name is not None:
+            self.phase_times[self._phase_name] = now - self._phase_start
+        self._phase_name = name
+        self._phase_start = now
+    
+    def _get_size_for_history(self, file_path: str) -> int:
+        """Size of a file about to be moved, only looked up when run history is kept."""
+        if not self.history_db:
+            return 0
+        # Reuse a stat the scan already took, but do not cache new ones: the
+        # history needs a single int per file, not a whole stat_result
+        file_stat = self._stat_cache.get(file_path)
+        if file_stat is not None:
+            return file_stat.st_size
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return 0
+    
+    def _ruleset_hash(self) -> str:
+        """Short fingerprint of everything that decides where files go."""
+        import hashlib
+        import json
+        rules = self._ignore_rules
+        ruleset = {
+            'file_types': sorted(self.file_types.items()),
+            'layout': self.layout,
+            'ignore': [rule[0].pattern for rule in rules.rules] if rules else None,
+        }
+        return hashlib.sha256(json.dumps(ruleset).encode('utf-8')).hexdigest()[:16]
+    
+    def _open_history(self):
+        """Open (and if needed create) the run history database."""
+        import sqlite3
+        connection = sqlite3.connect(self.history_db)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                root TEXT NOT NULL,
+                started REAL NOT NULL,
+                dry_run INTEGER NOT NULL,
+                duration REAL NOT NULL,
+                phases TEXT NOT NULL,
+                files INTEGER NOT NULL,
+                bytes INTEGER NOT NULL,
+                files_per_sec REAL NOT NULL,
+                bytes_per_sec REAL NOT NULL,
+                files_moved INTEGER NOT NULL,
+                files_skipped INTEGER NOT NULL,
+                folders_created INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                ruleset TEXT NOT NULL
+            )""")
+        connection.execute("CREATE INDEX IF NOT EXISTS runs_by_root ON runs (root, started)")
+        return connection
+    
+    def _record_run(self, started: float, files_found: int):
+        """Append this run's totals and phase timings to the run history."""
+        import json
+        import sqlite3
+        duration = sum(self.phase_times.values())
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.history_db)), exist_ok=True)
+            connection = self._open_history()
+            with connection:
+                connection.execute(
+                    "INSERT INTO runs (root, started, dry_run, duration, phases, files, bytes, files_per_sec,"
+                    " bytes_per_sec, files_moved, files_skipped, folders_created, errors, ruleset)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (os.path.abspath(self.target_dir), started, int(self.dry_run), duration,
+                     json.dumps({name: round(seconds, 6) for name, seconds in self.phase_times.items()}),
+                     files_found, self.bytes_moved,
+                     files_found / duration if duration else 0.0,
+                     self.bytes_moved / duration if duration else 0.0,
+                     self.stats['files_moved'], self.stats['files_skipped'],
+                     self.stats['folders_created'], self.stats['errors'], self._ruleset_hash()))
+            connection.close()
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error(f"Failed to record run history in {self.history_db}: {e}")
+    
+    def get_history(self, limit: int = 20) -> list[dict]:
+        """
+        Return the latest runs on the target directory, oldest first, each
+        with its rolling baseline throughput and a regression flag. A run is
+        only compared with earlier runs in the same mode under the same rules,
+        so changing the rules starts a new baseline.
+        """
+        import json
+        import sqlite3
+        import statistics
+        if not self.history_db or not os.path.exists(self.history_db):
+            return []
+        connection = self._open_history()
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute(
+            "SELECT * FROM runs WHERE root = ? ORDER BY started",
+            (os.path.abspath(self.target_dir),)).fetchall()
+        connection.close()
+        
+        runs = []
+        previous = {}  # (dry_run, ruleset) -> throughput of earlier runs
+        for row in rows:
+            run = dict(row)
+            run['phases'] = json.loads(run['phases'])
+            earlier = previous.setdefault((run['dry_run'], run['ruleset']), [])
+            run['baseline_files_per_sec'] = None
+            run['regression'] = False
+            if len(earlier) >= HISTORY_MIN_BASELINE:
+                baseline = statistics.median(earlier[-HISTORY_BASELINE_RUNS:])
+                run['baseline_files_per_sec'] = baseline
+                run['regression'] = run['files_per_sec'] < baseline * (1 - HISTORY_REGRESSION_DROP)
+            if run['files']:
+                earlier.append(run['files_per_sec'])
+            runs.append(run)
+        return runs[-limit:]
+    
+    def show_history(self, limit: int = 20) -> list[dict]:
+        """Print the latest runs on the target directory and flag throughput regressions."""
+        runs = self.get_history(limit)
+        self.logger.info("\n" + "="*50)
+        self.logger.info("RUN HISTORY")
+        self.logger.info("="*50)
+        self.logger.info(f"Target Directory: {self.target_dir}")
+        if not runs:
+            self.logger.info("No runs recorded yet.")
+        for run in runs:
+            started = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['started']))
+            line = (f"{started} {'DRY RUN' if run['dry_run'] else 'EXECUTE'}: {run['files']} files"
+                    f" in {run['duration']:.2f}s, {run['files_per_sec']:,.0f} files/s,"
+                    f" {self._format_bytes(run['bytes_per_sec'])}/s, {run['errors']} errors")
+            if run['regression']:
+                drop = 1 - run['files_per_sec'] / run['baseline_files_per_sec']
+                phase, seconds = max(run['phases'].items(), key=lambda item: item[1])
+                line += (f"  <-- REGRESSION: {drop:.0%} below baseline of {run['baseline_files_per_sec']:,.0f}"
+                         f" files/s (slowest phase: {phase}, {seconds:.2f}s)")
+                self.logger.warning(line)
+            else:
+                self.logger.info(line)
+        regressions = sum(1 for run in runs if run['regression'])
+        if regressions:
+            self.logger.info(f"{regressions} run(s) ran significantly slower than their baseline")
+        self.logger.info("="*50)
+        return runs
+    
+    def estimate(self, sample_size: int = 1000, confidence: float = 0.95) -> dict:
+        """
+        Preview a run from a random sample instead of planning every file.
+        
+        Directory entries are enumerated without stat calls; only a reservoir
+        sample of them is classified, stat'ed and checked for collisions. The
+        per-category counts, bytes, collisions and runtime are then projected
+        to the whole directory with normal-approximation confidence intervals.
+        
+        Args:
+            sample_size: Maximum number of files to inspect
+            confidence: Confidence level of the intervals (see CONFIDENCE_Z)
+        """
+        import random
+        import statistics
+        
+        if sample_size < 1:
+            raise ValueError("sample_size must be at least 1")
+        if confidence not in CONFIDENCE_Z:
+            raise ValueError(f"Unsupported confidence level {confidence} (expected one of: "
+                             f"{', '.join(str(level) for level in CONFIDENCE_Z)})")
+        z = CONFIDENCE_Z[confidence]
+        
+        self.logger.info(f"Estimating organization of: {self.target_dir}")
+        if not os.path.exists(self.target_dir):
+            self.logger.error(f"Target directory does not exist: {self.target_dir}")
+            return {}
+        
+        # Reservoir sampling (Algorithm R) over the enumerated candidates
+        rng = random.Random()
+        sample = []
+        total_files = 0
+        scan_start = time.perf_counter()
+        try:
+            for file_path in self._iter_files_to_organize(cache_stats=False):
+                total_files += 1
+                if len(sample) < sample_size:
+                    sample.append(file_path)
+                else:
+                    slot = rng.randrange(total_files)
+                    if slot < sample_size:
+                        sample[slot] = file_path
+        except OSError as e:
+            self.logger.error(f"Failed to get files from {self.target_dir}: {e}")
+            return {}
+        scan_seconds = time.perf_counter() - scan_start
+        
+        # Plan each sampled file exactly as organize_files would, timing the metadata work
+        self._stat_cache = {}
+        category_counts = {}
+        sizes = []
+        collisions = []
+        timings = []
+        for file_path in sample:
+            start = time.perf_counter()
+            try:
+                category = self._get_category(file_path)
+                size = self._get_file_stat(file_path).st_size
+                destination = os.path.join(self._get_destination_folder(category, file_path),
+                                           os.path.basename(file_path))
+                collides = os.path.exists(destination)
+            except OSError:
+                # Vanished or unreadable since enumeration; leave it out of the sample
+                continue
+            timings.append(time.perf_counter() - start)
+            category_counts[category] = category_counts.get(category, 0) + 1
+            sizes.append(size)
+            collisions.append(1 if collides else 0)
+        
+        sampled = len(sizes)
+        # Finite population correction: intervals shrink to zero for a full census
+        fpc = (total_files - sampled) / (total_files - 1) if total_files > 1 else 0.0
+        
+        def project_proportion(count: int) -> tuple[float, float]:
+            p = count / sampled
+            return total_files * p, z * total_files * (p * (1 - p) / sampled * fpc) ** 0.5
+        
+        def project_total(values: list) -> tuple[float, float]:
+            spread = statistics.stdev(values) if len(values) > 1 else 0.0
+            return total_files * statistics.mean(values), z * total_files * spread / sampled ** 0.5 * fpc ** 0.5
+        
+        result = {
+            'files_total': total_files,
+            'sample_size': sampled,
+            'confidence': confidence,
+            'categories': {},
+            'moves': (0.0, 0.0),
+            'collisions': (0.0, 0.0),
+            'bytes': (0.0, 0.0),
+            'runtime_seconds': (scan_seconds, 0.0),
+        }
+        if sampled:
+            result['categories'] = {category: project_proportion(count)
+                                    for category, count in sorted(category_counts.items())}
+            result['collisions'] = project_proportion(sum(collisions))
+            result['moves'] = project_proportion(sampled - sum(collisions))
+            result['bytes'] = project_total(sizes)
+            # A move costs a destination lookup plus a rename, which is about
+            # the stat + lookup pair timed per sampled file
+            per_file_seconds, per_file_margin = project_total(timings)
+            result['runtime_seconds'] = (scan_seconds + per_file_seconds, per_file_margin)
+        
+        self._print_estimate(result)
+        return result
+    
+    def _format_bytes(self, size: float) -> str:
+        """Format a byte count for display."""
+        for unit in ("B", "KB", "MB", "GB", "TB"):
+            if abs(size) < 1024 or unit == "TB":
+                return f"{size:.1f} {unit}" if unit != "B" else f"{size:.0f} B"
+            size /= 1024
+    
+    def _print_estimate(self, result: dict):
+        """Print the projections produced by estimate()."""
+        self.logger.info("\n" + "="*50)
+        self.logger.info("ORGANIZATION ESTIMATE")
+        self.logger.info("="*50)
+        self.logger.info(f"Files found: {result['files_total']:,} (sampled {result['sample_size']:,}, "
+                         f"{result['confidence']:.0%} confidence)")
+        for category, (count, margin) in result['categories'].items():
+            self.logger.info(f"  {category.capitalize()}: {count:,.0f} ± {margin:,.0f}")
+        self.logger.info(f"Expected moves: {result['moves'][0]:,.0f} ± {result['moves'][1]:,.0f}")
+        self.logger.info(f"Expected skips (already exist): {result['collisions'][0]:,.0f} ± {result['collisions'][1]:,.0f}")
+        self.logger.info(f"Expected bytes: {self._format_bytes(result['bytes'][0])} ± {self._format_bytes(result['bytes'][1])}")
+        self.logger.info(f"Projected runtime: {result['runtime_seconds'][0]:,.1f}s ± {result['runtime_seconds'][1]:,.1f}s")
+        self.logger.info("="*50)
+    
+    def _load_view_state(self, state_file: str) -> tuple[str, dict]:
+        """Load the link mode and index written by the previous view sync."""
+        import json
+        try:
+            with open(state_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None, {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable view state {state_file}: {e}")
+            return None, {}
+        return state.get('mode'), state.get('links', {})
+    
+    def _save_view_state(self, state_file: str, links: dict):
+        """Atomically replace the link index for the next view sync."""
+        import json
+        temp_file = f"{state_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'mode': self.view_mode, 'links': links}, f)
+        os.replace(temp_file, state_file)
+    
+    def _create_view_link(self, source: str, link_path: str):
+        """Create a symlink, hardlink or reflink to source at link_path."""
+        if self.view_mode == "symlink":
+            os.symlink(os.path.abspath(source), link_path)
+        elif self.view_mode == "hardlink":
+            os.link(source, link_path)
+        else:
+            import fcntl
+            with open(source, 'rb') as src, open(link_path, 'xb') as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                except OSError:
+                    dst.close()
+                    os.unlink(link_path)
+                    raise
+    
+    def _view_link_matches(self, source: str, link_path: str) -> bool:
+        """Check whether an existing entry in the view already links to source."""
+        if self.view_mode == "symlink":
+            return os.path.islink(link_path) and os.readlink(link_path) == os.path.abspath(source)
+        if self.view_mode == "hardlink":
+            link_stat = os.lstat(link_path)
+            source_stat = os.stat(source)
+            return (link_stat.st_ino, link_stat.st_dev) == (source_stat.st_ino, source_stat.st_dev)
+        # A reflink is an independent file; it cannot be told apart from a stale copy
+        return False
+    
+    def sync_view(self, view_mode: str, view_dir: str = None) -> dict[str, int]:
+        """
+        Build or update a categorized mirror of the target directory made of
+        links, without moving any file. Only links whose source was added,
+        removed or renamed since the last sync are touched; hardlinks and
+        reflinks are also refreshed when the source file was replaced or changed.
+        
+        Args:
+            view_mode: Link type, one of VIEW_MODES
+            view_dir: Root of the mirror tree (default: <target>/organized_view)
+        """
+        if view_mode not in VIEW_MODES:
+            raise ValueError(f"Unknown view mode '{view_mode}' (expected one of: {', '.join(VIEW_MODES)})")
+        self.view_mode = view_mode
+        view_dir = view_dir or os.path.join(self.target_dir, "organized_view")
+        view_stats = {'links_created': 0, 'links_removed': 0, 'links_kept': 0, 'errors': 0}
+        
+        self.logger.info(f"Syncing {view_mode} view of {self.target_dir} in: {view_dir}")
+        self.logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'EXECUTE'}")
+        self.logger.info("-" * 50)
+        
+        if not os.path.exists(self.target_dir):
+            self.logger.error(f"Target directory does not exist: {self.target_dir}")
+            return view_stats
+        
+        self._stat_cache = {}
+        state_file = os.path.join(view_dir, VIEW_STATE_FILE)
+        previous_mode, previous_links = self._load_view_state(state_file)
+        if previous_links and previous_mode != view_mode:
+            # Links of another mode are all replaced; compare against nothing
+            self.logger.info(f"View mode changed from {previous_mode} to {view_mode}: relinking")
+            unchanged_links = {}
+        else:
+            unchanged_links = previous_links
+        
+        # Desired links, keyed by their path relative to the view root. Only
+        # hardlinks and reflinks need the source's identity to detect changes.
+        desired_links = {}
+        for file_path in self._get_files_to_organize():
+            try:
+                folder = self._get_destination_folder(self._get_category(file_path), file_path, root=view_dir)
+                identity = None
+                if view_mode != "symlink":
+                    file_stat = self._get_file_stat(file_path)
+                    identity = [file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns]
+            except OSError as e:
+                self.logger.error(f"Failed to read {os.path.basename(file_path)}: {e}")
+                view_stats['errors'] += 1
+                continue
+            link_path = os.path.join(folder, os.path.basename(file_path))
+            desired_links[os.path.relpath(link_path, view_dir)] = [os.path.abspath(file_path), identity]
+        
+        stale = [rel for rel, entry in previous_links.items() if unchanged_links.get(rel) != entry
+                 or desired_links.get(rel) != entry]
+        missing = [rel for rel, entry in desired_links.items() if unchanged_links.get(rel) != entry]
+        view_stats['links_kept'] = len(desired_links) - len(missing)
+        
+        current_links = dict(previous_links)
+        for rel in stale:
+            link_path = os.path.join(view_dir, rel)
+            if self.dry_run:
+                self.logger.info(f"[DRY RUN] Would remove link: {rel}")
+                view_stats['links_removed'] += 1
+                continue
+            try:
+                os.unlink(link_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.error(f"Failed to remove link {rel}: {e}")
+                view_stats['errors'] += 1
+                continue
+            del current_links[rel]
+            self.logger.info(f"Removed link: {rel}")
+            view_stats['links_removed'] += 1
+        
+        if not self.dry_run:
+            for folder in sorted({os.path.dirname(os.path.join(view_dir, rel)) for rel in missing}):
+                os.makedirs(folder, exist_ok=True)
+        
+        for rel in missing:
+            source, identity = desired_links[rel]
+            if self.dry_run:
+                self.logger.info(f"[DRY RUN] Would link: {os.path.basename(source)} -> {rel}")
+                view_stats['links_created'] += 1
+                continue
+            link_path = os.path.join(view_dir, rel)
+            try:
+                # Entries the index does not know about (lost or unreadable
+                # state file) are adopted when correct and replaced otherwise
+                if os.path.lexists(link_path):
+                    if self._view_link_matches(source, link_path):
+                        current_links[rel] = [source, identity]
+                        self.logger.info(f"Adopted existing link: {rel}")
+                        view_stats['links_kept'] += 1
+                        continue
+                    os.unlink(link_path)
+                self._create_view_link(source, link_path)
+            except OSError as e:
+                self.logger.error(f"Failed to link {os.path.basename(source)}: {e}")
+                view_stats['errors'] += 1
+                continue
+            current_links[rel] = [source, identity]
+            self.logger.info(f"Linked: {os.path.basename(source)} -> {rel}")
+            view_stats['links_created'] += 1
+        
+        if not self.dry_run and (stale or missing or previous_mode != view_mode):
+            try:
+                os.makedirs(view_dir, exist_ok=True)
+                self._save_view_state(state_file, current_links)
+            except OSError as e:
+                self.logger.error(f"Failed to save view state {state_file}: {e}")
+                view_stats['errors'] += 1
+        
+        self.logger.info("\n" + "="*50)
+        self.logger.info("VIEW SUMMARY")
+        self.logger.info("="*50)
+        if self.dry_run:
+            self.logger.info("This was a DRY RUN - no links were actually changed")
+        self.logger.info(f"Links created: {view_stats['links_created']}")
+        self.logger.info(f"Links removed: {view_stats['links_removed']}")
+        self.logger.info(f"Links unchanged: {view_stats['links_kept']}")
+        self.logger.info(f"Errors: {view_stats['errors']}")
+        self.logger.info("="*50)
+        return view_stats
     
     def _print_summary(self):
         """Print operation summary."""
@@ -412,8 +1940,55 @@ class DesktopOrganizer:
                 break
 
 
+# Options understood by the --fast path without argparse: flags, and options taking a value
+FAST_FLAGS = ("--fast", "--dry-run", "--no-interactive", "--no-logging")
+FAST_OPTIONS = {"--target-dir": "target_dir", "--layout": "layout", "--ignore-file": "ignore_file"}
+
+
+def _parse_fast_args(argv: list[str]) -> dict | None:
+    """
+    Parse a --fast command line by hand, so watch hooks calling the organizer
+    for every file never import argparse (and the re, enum and shutil it pulls
+    in). Returns DesktopOrganizer arguments, or None to use the full parser
+    (no --fast, other options, or anything that needs an error message).
+    """
+    if "--fast" not in argv:
+        return None
+    options = {'dry_run': False}
+    args = iter(argv)
+    for arg in args:
+        name, has_value, value = arg.partition("=")
+        if not has_value and name in FAST_FLAGS:
+            if name == "--dry-run":
+                options['dry_run'] = True
+        elif name in FAST_OPTIONS:
+            if not has_value:
+                value = next(args, None)
+                if value is None:
+                    return None
+            options[FAST_OPTIONS[name]] = value
+        else:
+            return None
+    if options.get('layout', "flat") not in LAYOUTS:
+        return None
+    return options
+
+
 def main():
     """Main function with both interactive and command-line modes."""
+    fast_options = _parse_fast_args(sys.argv[1:])
+    if fast_options is not None:
+        try:
+            DesktopOrganizer(enable_logging=False, **fast_options).organize_files()
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user.")
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            sys.exit(1)
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Desktop Organizer - Windows Edition",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -422,6 +1997,17 @@ Examples:
   python desktop_organizer.py                    # Interactive mode
   python desktop_organizer.py --dry-run          # Command-line dry run
   python desktop_organizer.py --target-dir "C:\\MyFolder"  # Custom directory
+  python desktop_organizer.py --layout date      # Sort into <category>/YYYY/MM
+  python desktop_organizer.py --verify --no-interactive  # Checksum moves to other drives
+  python desktop_organizer.py --view symlink     # Linked category view, files stay put
+  python desktop_organizer.py --estimate         # Sampled preview of a huge directory
+  python desktop_organizer.py --serve            # Resident service on a Unix socket
+  python desktop_organizer.py --history          # Past runs and throughput regressions
+  python desktop_organizer.py --shard 0/4 --no-interactive  # First of 4 cooperating instances
+  python desktop_organizer.py --cold-root "D:\\Archive" --cold-after 180  # Tier old files
+  python desktop_organizer.py --reader getdents --reader-buffer 4096  # Huge directories
+  python desktop_organizer.py --profile --profile-cpu --dry-run  # Memory/CPU profile
+  python desktop_organizer.py --fast --target-dir "C:\\Drop"  # Quick run for watch hooks
         """
     )
     parser.add_argument(
@@ -444,17 +2030,216 @@ Examples:
         action="store_true",
         help="Disable file logging"
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Fast path for watch hooks and per-file calls: no menu and no log file"
+    )
+    parser.add_argument(
+        "--verify",
+        nargs="?",
+        const="readback",
+        choices=VERIFY_MODES,
+        help="Checksum files moved to another drive and check the copy before deleting the "
+             "source: readback (default) re-reads and re-hashes the copy, metadata checks its size only"
+    )
+    parser.add_argument(
+        "--view",
+        choices=VIEW_MODES,
+        help="Leave files in place and maintain a categorized tree of links to them instead"
+    )
+    parser.add_argument(
+        "--view-dir",
+        type=str,
+        help="Root of the linked view tree (default: <target>/organized_view)"
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="Preview the run from a random sample of files, with confidence intervals"
+    )
+    parser.add_argument(
+        "--sample-size",
+        type=int,
+        default=1000,
+        help="Number of files inspected by --estimate (default: 1000)"
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        choices=sorted(CONFIDENCE_Z),
+        default=0.95,
+        help="Confidence level of the --estimate intervals (default: 0.95)"
+    )
+    parser.add_argument(
+        "--ignore-file",
+        type=str,
+        help="Gitignore-style exclusion file (default: <target>/.organizerignore)"
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const="",
+        metavar="SOCKET",
+        help="Run as a resident service accepting JSON jobs on a Unix socket "
+             "(default: $XDG_RUNTIME_DIR/desktop_organizer.sock)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Jobs the --serve service runs at once, on different roots (default: 4)"
+    )
+    parser.add_argument(
+        "--max-organizers",
+        type=int,
+        default=64,
+        help="Warm organizers the --serve service keeps, least recently used dropped first (default: 64)"
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const=20,
+        type=int,
+        metavar="RUNS",
+        help="Show the last RUNS recorded runs (default: 20) and flag throughput regressions"
+    )
+    parser.add_argument(
+        "--history-db",
+        type=str,
+        help="Run history database (default: <target>/organizer_logs/history.sqlite3 when logging)"
+    )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        metavar="I/N",
+        help="Only handle partition I of N, so N instances (also on different hosts) can "
+             "organize the same directory together"
+    )
+    parser.add_argument(
+        "--lock-lease",
+        type=float,
+        default=DEFAULT_LOCK_LEASE,
+        help=f"Seconds a lock must go unrefreshed before it is broken as left by a dead instance (default: {DEFAULT_LOCK_LEASE:g})"
+    )
+    parser.add_argument(
+        "--cold-root",
+        type=str,
+        help="Cold tier directory for files untouched for --cold-after days (same category layout)"
+    )
+    parser.add_argument(
+        "--cold-after",
+        type=float,
+        metavar="DAYS",
+        help="Move files whose last access and modification are older than DAYS to --cold-root"
+    )
+    parser.add_argument(
+        "--cold-workers",
+        type=int,
+        default=DEFAULT_COLD_WORKERS,
+        help=f"Concurrent cold tier migrations (default: {DEFAULT_COLD_WORKERS})"
+    )
+    parser.add_argument(
+        "--cold-rate",
+        type=float,
+        default=0,
+        metavar="MB_PER_SEC",
+        help="Throttle cold tier migrations to this many MB/s (default: unlimited)"
+    )
+    parser.add_argument(
+        "--reader",
+        choices=READERS,
+        default="scandir",
+        help="Directory reader for the scan: getdents reads huge directories with fewer syscalls (Linux; default: scandir)"
+    )
+    parser.add_argument(
+        "--reader-buffer",
+        type=int,
+        default=DEFAULT_GETDENTS_BUFFER // 1024,
+        metavar="KB",
+        help=f"Buffer per getdents64 call in KiB (default: {DEFAULT_GETDENTS_BUFFER // 1024})"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="organizer_profile",
+        metavar="DIR",
+        help="Profile the run: tracemalloc snapshots at each phase boundary, written to DIR/<timestamp>/ "
+             "(default DIR: organizer_profile)"
+    )
+    parser.add_argument(
+        "--profile-cpu",
+        action="store_true",
+        help="With --profile, also run cProfile on the move phase"
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        metavar="N",
+        help="With --profile, number of allocation sites and functions reported (default: 25)"
+    )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="flat",
+        help="Folder layout inside each category: flat, date (YYYY/MM) or hash (two-character fan-out)"
+    )
     
     args = parser.parse_args()
+    if (args.cold_root is None) != (args.cold_after is None):
+        parser.error("--cold-root and --cold-after must be used together")
+    if args.reader_buffer * 1024 < MIN_GETDENTS_BUFFER:
+        parser.error(f"--reader-buffer must be at least {MIN_GETDENTS_BUFFER // 1024} KiB")
+    if args.shard is not None:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    if args.serve is not None:
+        from organizer_service import OrganizerService
+        try:
+            OrganizerService(args.serve or None, workers=args.workers,
+                             max_organizers=args.max_organizers).serve_forever()
+        except (OSError, RuntimeError) as e:
+            print(f"An error occurred: {e}")
+            sys.exit(1)
+        return
     
     try:
         organizer = DesktopOrganizer(
             target_dir=args.target_dir, 
             dry_run=args.dry_run,
-            enable_logging=not args.no_logging
+            enable_logging=not (args.no_logging or args.fast),
+            layout=args.layout,
+            verify=args.verify,
+            ignore_file=args.ignore_file,
+            history_db=args.history_db,
+            shard=args.shard,
+            lock_lease=args.lock_lease,
+            cold_root=args.cold_root,
+            cold_after_days=args.cold_after,
+            cold_workers=args.cold_workers,
+            cold_rate_limit=args.cold_rate * 1024 * 1024,
+            reader=args.reader,
+            getdents_buffer=args.reader_buffer * 1024
         )
         
-        if args.no_interactive or args.dry_run:
+        if args.history is not None:
+            # Report only
+            organizer.show_history(args.history)
+        elif args.estimate:
+            # Sampled preview; never moves anything
+            organizer.estimate(args.sample_size, args.confidence)
+        elif args.view:
+            # Non-destructive linked view
+            organizer.sync_view(args.view, args.view_dir)
+        elif args.profile is not None:
+            # Command-line mode under the memory/CPU profiler
+            from organizer_profiler import OrganizerProfiler
+            OrganizerProfiler(organizer, args.profile, top=args.profile_top, cpu=args.profile_cpu).run()
+        elif args.no_interactive or args.dry_run or args.fast:
             # Command-line mode
             organizer.organize_files()
         else:
@@ -23,7 +23,8 @@ def create_test_files():
         print(f"Error: Desktop directory not found at {desktop_path}")
         if platform.system() == "Windows":
             print("Make sure you have a Desktop folder in your user profile.")
-            print(f"Expected location: {os.environ.get('USERPROFILE', 'C:\\Users\\YourName')}\\Desktop")
+            user_profile = os.environ.get('USERPROFILE', 'C:\\Users\\YourName')
+            print(f"Expected location: {user_profile}\\Desktop")
         return
     
     print("=" * 40)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Desktop Organizer Profiler
+Memory and CPU profiling harness behind --profile. While organize_files()
+runs it takes a tracemalloc snapshot at every phase boundary (scan, plan,
+folders, move, cold, report) and can run cProfile on the move phase. Each run
+writes a directory that can be compared with a later one:
+
+  organizer_profile/20261019_101500/
+    summary.json          phases, traced/peak memory, RSS, top allocation sites
+    memory.txt            the same as a readable report, plus per-phase growth
+    snapshots/*.tracemalloc  raw snapshots (tracemalloc.Snapshot.load)
+    cpu_move.pstats       cProfile data for the move phase (--profile-cpu)
+    cpu_move.txt          its top functions by cumulative time
+
+Compare two runs, e.g. before and after a change:
+
+  python organizer_profiler.py compare organizer_profile/OLD organizer_profile/NEW
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+PROFILE_DIR = "organizer_profile"
+DEFAULT_TOP = 25
+CPU_PHASES = ("move", "cold")
+
+
+def _rss() -> tuple:
+    """Return (current RSS, peak RSS) in bytes; None where the platform does not tell."""
+    current = peak = None
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = max_rss if sys.platform == "darwin" else max_rss * 1024
+    except ImportError:
+        pass
+    return current, peak
+
+
+def _site(stat: tracemalloc.Statistic) -> dict:
+    """JSON form of an allocation site statistic."""
+    frame = stat.traceback[0]
+    return {'file': frame.filename, 'line': frame.lineno, 'size': stat.size, 'count': stat.count}
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size:.0f} B"
+        size /= 1024
+
+
+def _format_delta(size: float) -> str:
+    return ("+" if size >= 0 else "-") + _format_size(abs(size))
+
+
+class OrganizerProfiler:
+    """Profiles one DesktopOrganizer run by hooking its phase boundaries."""
+
+    def __init__(self, organizer, output_dir: str = PROFILE_DIR, top: int = DEFAULT_TOP, cpu: bool = False,
+                 frames: int = 1):
+        """
+        Initialize the profiler.
+
+        Args:
+            organizer: DesktopOrganizer instance to profile
+            output_dir: Parent directory; each run writes a timestamped subdirectory
+            top: Number of allocation sites (and CPU functions) to report
+            cpu: If True, run cProfile on the move and cold phases
+            frames: Traceback depth recorded by tracemalloc (1 = allocation line only)
+        """
+        self.organizer = organizer
+        self.run_dir = os.path.join(output_dir, time.strftime('%Y%m%d_%H%M%S'))
+        suffix = 2
+        while os.path.exists(self.run_dir):
+            self.run_dir = os.path.join(output_dir, f"{time.strftime('%Y%m%d_%H%M%S')}_{suffix}")
+            suffix += 1
+        self.top = top
+        self.cpu = cpu
+        self.frames = frames
+        self.phases = []
+        self._previous = None
+        self._cpu_profiles = {}
+        self._active_cpu = None
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+
+    def run(self) -> dict:
+        """Run organize_files() under the profiler, write the report and return the stats."""
+        organizer = self.organizer
+        os.makedirs(os.path.join(self.run_dir, "snapshots"), exist_ok=True)
+        start_phase = organizer._start_phase
+
+        def profiled_start_phase(name):
+            finished = organizer._phase_name
+            start_phase(name)
+            self._phase_boundary(finished, name)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self.frames)
+        organizer._start_phase = profiled_start_phase
+        try:
+            self._record("start")
+            stats = organizer.organize_files()
+        finally:
+            del organizer._start_phase
+            self._stop_cpu()
+            if started_tracing:
+                tracemalloc.stop()
+        self._write_reports(stats)
+        organizer.logger.info(f"Profile written to: {self.run_dir}")
+        return stats
+
+    def _phase_boundary(self, finished: str, starting: str):
+        """Snapshot the phase that just ended and start/stop cProfile around the hot loop."""
+        self._stop_cpu()
+        if finished is not None:
+            self._record(finished)
+        if self.cpu and starting in CPU_PHASES:
+            import cProfile
+            self._active_cpu = (starting, cProfile.Profile())
+            self._active_cpu[1].enable()
+
+    def _stop_cpu(self):
+        if self._active_cpu is not None:
+            phase, profile = self._active_cpu
+            profile.disable()
+            self._cpu_profiles[phase] = profile
+            self._active_cpu = None
+
+    def _record(self, label: str):
+        """Take a snapshot after `label` and store its statistics."""
+        current, peak = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()  # Python 3.9+: peak per phase instead of since start
+        rss, max_rss = _rss()
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+        index = len(self.phases)
+        snapshot.dump(os.path.join(self.run_dir, "snapshots", f"{index:02d}_{label}.tracemalloc"))
+
+        phase = {
+            'phase': label,
+            'seconds': self.organizer.phase_times.get(label),
+            'traced_bytes': current,
+            'traced_peak_bytes': peak,
+            'rss_bytes': rss,
+            'max_rss_bytes': max_rss,
+            'top_sites': [_site(stat) for stat in snapshot.statistics('lineno')[:self.top]],
+            'top_files': [{'file': stat.traceback[0].filename, 'size': stat.size, 'count': stat.count}
+                          for stat in snapshot.statistics('filename')[:self.top]],
+            'growth': [],
+        }
+        if self._previous is not None:
+            # What this phase allocated and still holds when it ends
+            phase['growth'] = [
+                {**_site(diff), 'size_diff': diff.size_diff, 'count_diff': diff.count_diff}
+                for diff in snapshot.compare_to(self._previous, 'lineno')[:self.top]
+                if diff.size_diff
+            ]
+        self._previous = snapshot
+        self.phases.append(phase)
+
+    def _write_reports(self, stats: dict):
+        organizer = self.organizer
+        summary = {
+            'started': os.path.basename(self.run_dir),
+            'python': sys.version.split()[0],
+            'target_dir': organizer.target_dir,
+            'dry_run': organizer.dry_run,
+            'layout': organizer.layout,
+            'files': organizer._run_file_count,
+            'stats': dict(stats),
+            'phase_seconds': dict(organizer.phase_times),
+            'tracemalloc_frames': self.frames,
+            'phases': self.phases,
+            'cpu_profiles': sorted(self._cpu_profiles),
+        }
+        with open(os.path.join(self.run_dir, "summary.json"), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+        lines = [f"Desktop Organizer memory profile: {organizer.target_dir}",
+                 f"Files: {organizer._run_file_count}, stats: {dict(stats)}", ""]
+        for phase in self.phases:
+            rss = _format_size(phase['rss_bytes']) if phase['rss_bytes'] is not None else "n/a"
+            seconds = f", {phase['seconds']:.3f} s" if phase['seconds'] is not None else ""
+            lines.append(f"== after {phase['phase']}{seconds}: traced {_format_size(phase['traced_bytes'])}, "
+                         f"peak {_format_size(phase['traced_peak_bytes'])}, RSS {rss}")
+            for site in phase['top_sites']:
+                lines.append(f"  {_format_size(site['size']):>12}  {site['count']:>8}  {site['file']}:{site['line']}")
+            if phase['growth']:
+                lines.append("  growth during this phase:")
+                for site in phase['growth']:
+                    lines.append(f"  {_format_delta(site['size_diff']):>12}  {site['count_diff']:>+8}  "
+                                 f"{site['file']}:{site['line']}")
+            lines.append("")
+        with open(os.path.join(self.run_dir, "memory.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+
+        import pstats
+        for phase, profile in self._cpu_profiles.items():
+            profile.dump_stats(os.path.join(self.run_dir, f"cpu_{phase}.pstats"))
+            with open(os.path.join(self.run_dir, f"cpu_{phase}.txt"), 'w', encoding='utf-8') as f:
+                pstats.Stats(profile, stream=f).sort_stats('cumulative').print_stats(self.top)
+
+
+def compare(old_dir: str, new_dir: str, top: int = 10, key: str = 'lineno') -> str:
+    """Report per-phase memory changes between two profile runs (old -> new)."""
+    def load(run_dir):
+        with open(os.path.join(run_dir, "summary.json"), encoding='utf-8') as f:
+            summary = json.load(f)
+        snapshots = {}
+        for name in sorted(os.listdir(os.path.join(run_dir, "snapshots"))):
+            label = os.path.splitext(name)[0].split('_', 1)[1]
+            snapshots[label] = os.path.join(run_dir, "snapshots", name)
+        return summary, snapshots
+
+    old, old_snapshots = load(old_dir)
+    new, new_snapshots = load(new_dir)
+    lines = [f"old: {old_dir} ({old['files']} files)", f"new: {new_dir} ({new['files']} files)", ""]
+    old_phases = {phase['phase']: phase for phase in old['phases']}
+    for phase in new['phases']:
+        before = old_phases.get(phase['phase'])
+        if before is None:
+            continue
+        lines.append(
+            f"== after {phase['phase']}: traced {_format_size(before['traced_bytes'])} -> "
+            f"{_format_size(phase['traced_bytes'])}, peak {_format_size(before['traced_peak_bytes'])} -> "
+            f"{_format_size(phase['traced_peak_bytes'])}"
+        )
+        if phase['phase'] in old_snapshots and phase['phase'] in new_snapshots:
+            new_snapshot = tracemalloc.Snapshot.load(new_snapshots[phase['phase']])
+            old_snapshot = tracemalloc.Snapshot.load(old_snapshots[phase['phase']])
+            for diff in new_snapshot.compare_to(old_snapshot, key)[:top]:
+                if diff.size_diff:
+                    frame = diff.traceback[0]
+                    location = frame.filename if key == 'filename' else f"{frame.filename}:{frame.lineno}"
+                    lines.append(f"  {_format_delta(diff.size_diff):>12}  {diff.count_diff:>+8}  {location}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Desktop Organizer profile tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser("compare", help="Compare two --profile runs")
+    compare_parser.add_argument("old", help="Profile run directory of the baseline")
+    compare_parser.add_argument("new", help="Profile run directory to compare with it")
+    compare_parser.add_argument("--top", type=int, default=10, help="Sites listed per phase")
+    compare_parser.add_argument("--group-by", choices=("lineno", "filename"), default="lineno",
+                                help="Group allocations by line or by file (lines shift between versions)")
+    args = parser.parse_args()
+    print(compare(args.old, args.new, args.top, args.group_by))
+
+
+if __name__ == "__main__":
+    main()
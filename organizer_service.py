@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Desktop Organizer Service
+Keeps DesktopOrganizer instances resident and accepts JSON job requests over a
+Unix domain socket, so frequent small jobs (e.g. from upload hooks) cost a
+socket round trip instead of a new Python process.
+
+Protocol: one JSON object per line in each direction.
+
+  {"op": "organize", "root": "/srv/drop", "dry_run": false, "wait": false}
+  {"op": "stats", "root": "/srv/drop"}
+  {"op": "status", "job": 12}
+  {"op": "metrics"}
+  {"op": "ping"}
+
+Every response carries "ok"; failures add an "error" message.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+
+from desktop_organizer import DesktopOrganizer, LAYOUTS, _ConsoleLogger
+
+DEFAULT_MAX_ORGANIZERS = 64
+
+
+def default_socket_path() -> str:
+    """Per-user default socket location."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or os.path.expanduser("~")
+    return os.path.join(runtime_dir, "desktop_organizer.sock")
+
+
+class OrganizerService:
+    """Job queue with per-root serialization in front of warm DesktopOrganizer instances."""
+
+    def __init__(self, socket_path: str = None, workers: int = 4, verbose: bool = False,
+                 history_size: int = 1000, max_organizers: int = DEFAULT_MAX_ORGANIZERS):
+        """
+        Initialize the service.
+
+        Args:
+            socket_path: Unix socket to listen on (default: default_socket_path())
+            workers: Number of jobs that may run at once (on different roots)
+            verbose: If True, echo the organizers' per-file output to stderr
+            history_size: Number of finished jobs kept for status queries
+            max_organizers: Number of warm organizers kept; the least recently
+                used (root, layout) is dropped beyond it
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("The organizer service needs Unix domain sockets, which this platform lacks")
+
+        self.socket_path = socket_path or default_socket_path()
+        self.workers = max(1, workers)
+        self.verbose = verbose
+        self.history_size = history_size
+        self.max_organizers = max(1, max_organizers)
+
+        self._lock = threading.Lock()
+        self._ready_roots = deque()
+        self._ready = threading.Condition(self._lock)
+        self._pending = {}         # root -> deque of queued jobs
+        self._active_roots = set()  # roots queued for or held by a worker
+        self._jobs = OrderedDict()  # job id -> job record, oldest first
+        self._organizers = OrderedDict()  # (root, layout) -> warm DesktopOrganizer, least recently used first
+        self._next_job_id = 1
+        self._started = time.time()
+        self._running = False
+        self._server = None
+        self._quiet_stream = None if verbose else open(os.devnull, 'w')
+        self.metrics = {
+            'jobs_submitted': 0,
+            'jobs_completed': 0,
+            'jobs_failed': 0,
+            'files_moved': 0,
+            'errors': 0,
+            'busy_seconds': 0.0,
+        }
+
+    # Jobs
+
+    def _get_organizer(self, root: str, layout: str) -> DesktopOrganizer:
+        """Return the resident organizer for a root, creating it on first use."""
+        key = (root, layout)
+        with self._lock:
+            organizer = self._organizers.get(key)
+            if organizer is not None:
+                self._organizers.move_to_end(key)
+                return organizer
+        organizer = DesktopOrganizer(target_dir=root, enable_logging=False, layout=layout)
+        if not self.verbose:
+            organizer.logger = _ConsoleLogger(stream=self._quiet_stream)
+        with self._lock:
+            self._organizers[key] = organizer
+            # Jobs on one root never overlap, so an evicted organizer is at most
+            # finishing the job that holds it and is not handed out again
+            while len(self._organizers) > self.max_organizers:
+                self._organizers.popitem(last=False)
+        return organizer
+
+    def submit(self, op: str, root: str, dry_run: bool = False, layout: str = "flat") -> dict:
+        """Queue a job; jobs on the same root run one at a time, in order."""
+        if not os.path.isabs(root) or not os.path.isdir(root):
+            raise ValueError(f"root must be an existing absolute directory: {root}")
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}' (expected one of: {', '.join(LAYOUTS)})")
+        root = os.path.normpath(root)
+
+        with self._lock:
+            job = {
+                'job': self._next_job_id,
+                'op': op,
+                'root': root,
+                'dry_run': dry_run,
+                'layout': layout,
+                'status': 'queued',
+                'submitted': time.time(),
+                'started': None,
+                'finished': None,
+                'result': None,
+                'error': None,
+                'done': threading.Event(),
+            }
+            self._next_job_id += 1
+            self._jobs[job['job']] = job
+            self._pending.setdefault(root, deque()).append(job)
+            if root not in self._active_roots:
+                self._active_roots.add(root)
+                self._ready_roots.append(root)
+                self._ready.notify()
+            self.metrics['jobs_submitted'] += 1
+            self._trim_history()
+        return job
+
+    def _trim_history(self):
+        """Forget the oldest finished jobs beyond history_size (lock held)."""
+        while len(self._jobs) > self.history_size:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest['finished'] is None:
+                break
+            del self._jobs[oldest_id]
+
+    def _run_job(self, job: dict):
+        """Execute one job on its root's resident organizer."""
+        organizer = self._get_organizer(job['root'], job['layout'])
+        try:
+            if job['op'] == 'organize':
+                organizer.dry_run = job['dry_run']
+                return dict(organizer.organize_files())
+            # "stats": category distribution of the files currently in the root
+            counts = {}
+            for file_path in organizer._get_files_to_organize():
+                category = organizer._get_category(file_path)
+                counts[category] = counts.get(category, 0) + 1
+            return {'files_found': sum(counts.values()), 'categories': counts}
+        finally:
+            # A resident organizer keeps only its configuration between jobs
+            organizer._stat_cache = {}
+
+    def _worker(self):
+        """Take the next ready root, run its oldest job and requeue the root if more are waiting."""
+        while True:
+            with self._lock:
+                while self._running and not self._ready_roots:
+                    self._ready.wait()
+                if not self._running:
+                    return
+                root = self._ready_roots.popleft()
+                job = self._pending[root].popleft()
+                job['status'] = 'running'
+                job['started'] = time.time()
+
+            try:
+                result, error = self._run_job(job), None
+            except Exception as e:
+                result, error = None, str(e)
+
+            with self._lock:
+                job['finished'] = time.time()
+                job['result'] = result
+                job['error'] = error
+                job['status'] = 'failed' if error else 'done'
+                self.metrics['busy_seconds'] += job['finished'] - job['started']
+                if error:
+                    self.metrics['jobs_failed'] += 1
+                else:
+                    self.metrics['jobs_completed'] += 1
+                    if job['op'] == 'organize' and not job['dry_run']:
+                        self.metrics['files_moved'] += result['files_moved']
+                    self.metrics['errors'] += result.get('errors', 0)
+                if self._pending[root]:
+                    self._ready_roots.append(root)
+                    self._ready.notify()
+                else:
+                    del self._pending[root]
+                    self._active_roots.discard(root)
+                job['done'].set()
+
+    def job_status(self, job_id: int) -> dict:
+        """Public view of a job record."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown job: {job_id}")
+            return {key: value for key, value in job.items() if key != 'done'}
+
+    def get_metrics(self) -> dict:
+        """Service-wide counters and queue state."""
+        with self._lock:
+            metrics = dict(self.metrics)
+            finished = metrics['jobs_completed'] + metrics['jobs_failed']
+            metrics.update({
+                'uptime_seconds': time.time() - self._started,
+                'queued_jobs': sum(len(jobs) for jobs in self._pending.values()),
+                'running_jobs': sum(1 for job in self._jobs.values() if job['status'] == 'running'),
+                'active_roots': len(self._active_roots),
+                'resident_organizers': len(self._organizers),
+                'avg_job_seconds': metrics['busy_seconds'] / finished if finished else 0.0,
+            })
+        return metrics
+
+    # Requests
+
+    def handle_request(self, request: dict) -> dict:
+        """Dispatch one decoded request and build its response."""
+        op = request.get('op')
+        try:
+            if op == 'ping':
+                return {'ok': True}
+            if op == 'metrics':
+                return {'ok': True, 'metrics': self.get_metrics()}
+            if op == 'status':
+                return {'ok': True, **self.job_status(int(request['job']))}
+            if op in ('organize', 'stats'):
+                job = self.submit(op, request['root'], dry_run=bool(request.get('dry_run', False)),
+                                  layout=request.get('layout', 'flat'))
+                if op == 'stats' or request.get('wait'):
+                    job['done'].wait()
+                return {'ok': True, **self.job_status(job['job'])}
+            return {'ok': False, 'error': f"Unknown op: {op}"}
+        except (KeyError, TypeError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}
+
+    def _make_handler(self):
+        service = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                        if not isinstance(request, dict):
+                            raise ValueError("request must be a JSON object")
+                        response = service.handle_request(request)
+                    except ValueError as e:
+                        response = {'ok': False, 'error': f"Bad request: {e}"}
+                    self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+                    self.wfile.flush()
+
+        return RequestHandler
+
+    # Lifecycle
+
+    def start(self):
+        """Bind the socket and start the worker threads (non-blocking)."""
+        if os.path.exists(self.socket_path):
+            # Remove a stale socket left by a previous run, but never a live one
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                raise RuntimeError(f"Another organizer service is listening on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, self._make_handler())
+        self._server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+        self._running = True
+        for _ in range(self.workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop accepting requests and let the workers exit after their current job."""
+        with self._lock:
+            self._running = False
+            self._ready.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def serve_forever(self):
+        """Run until interrupted (Ctrl+C or SIGTERM)."""
+        import signal
+
+        def _interrupt(signum, frame):
+            raise KeyboardInterrupt
+
+        signal.signal(signal.SIGTERM, _interrupt)
+        self.start()
+        print(f"Desktop Organizer service listening on {self.socket_path} ({self.workers} workers)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print("\nStopping service...")
+        finally:
+            self.stop()
+
+
+def request(payload: dict, socket_path: str = None, timeout: float = None) -> dict:
+    """Send one request to a running service and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path or default_socket_path())
+        client.sendall(json.dumps(payload).encode('utf-8') + b"\n")
+        with client.makefile('rb') as reader:
+            return json.loads(reader.readline())
+
+
+if __name__ == "__main__":
+    OrganizerService(sys.argv[1] if len(sys.argv) > 1 else None).serve_forever()
@@ -4,11 +4,17 @@ Test script for the Desktop Organizer
 Creates sample files and tests the organizer functionality
 """
 
+import hashlib
+import json
 import os
 import tempfile
 import shutil
+import socket
+import threading
+import time
 from pathlib import Path
-from desktop_organizer import DesktopOrganizer
+from desktop_organizer import (DesktopOrganizer, FILE_TYPES, IgnoreRules, LeaseLock, iter_getdents,
+                               load_getdents64, parse_shard)
 
 
 def create_test_files(test_dir: str) -> None:
@@ -77,5 +83,589 @@ def test_organizer():
         return stats
 
 
+def test_sharded_layouts():
+    """Test the date and hash destination layouts."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        photo = os.path.join(temp_dir, "test_image.jpg")
+        os.utime(photo, (0, 1700000000))  # November 2023
+        
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, layout="date")
+        organizer.organize_files()
+        
+        modified = time.localtime(1700000000)
+        expected = os.path.join(temp_dir, "images", f"{modified.tm_year:04d}",
+                                f"{modified.tm_mon:02d}", "test_image.jpg")
+        assert os.path.isfile(expected)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, layout="hash")
+        stats = organizer.organize_files()
+        
+        shards = os.listdir(os.path.join(temp_dir, "images"))
+        assert len(shards) == 1 and len(shards[0]) == 2
+        assert stats['files_moved'] == 13
+        assert stats['errors'] == 0
+
+
+def test_fast_path_skips_log_directory():
+    """Test that runs without file logging leave no organizer_logs folder behind."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+        organizer.organize_files()
+        
+        assert not os.path.exists(os.path.join(temp_dir, "organizer_logs"))
+        assert organizer.file_types is FILE_TYPES
+
+
+def test_verified_cross_device_moves():
+    """Test that --verify hashes copied files and records their digests."""
+    for mode in ("readback", "metadata"):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            create_test_files(temp_dir)
+            organizer = DesktopOrganizer(target_dir=temp_dir, verify=mode)
+            # Treat every destination as another drive to force the copy path
+            organizer._is_cross_device = lambda source, destination: True
+            stats = organizer.organize_files()
+            
+            assert stats['files_moved'] == 13 and stats['errors'] == 0
+            assert not os.path.exists(os.path.join(temp_dir, "test_image.jpg"))
+            
+            log_dir = os.path.join(temp_dir, "organizer_logs")
+            reports = [name for name in os.listdir(log_dir) if name.endswith('.sha256')]
+            assert len(reports) == 1
+            with open(os.path.join(log_dir, reports[0]), encoding='utf-8') as f:
+                entries = dict(line.rstrip('\n').split('  ', 1)[::-1] for line in f)
+            
+            image = os.path.join(temp_dir, "images", "test_image.jpg")
+            with open(image, 'rb') as f:
+                assert entries[image] == hashlib.sha256(f.read()).hexdigest()
+    
+    # Without posix_fadvise the copy is still re-hashed, so a corrupted copy is caught
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, verify="readback")
+        organizer._is_cross_device = lambda source, destination: True
+        read_back = organizer._read_back_digest
+        
+        def corrupt_then_read_back(path):
+            with open(path, 'r+b') as f:
+                f.write(b"X")
+            return read_back(path)
+        
+        organizer._read_back_digest = corrupt_then_read_back
+        fadvise = getattr(os, 'posix_fadvise', None)
+        if fadvise is not None:
+            del os.posix_fadvise
+        try:
+            stats = organizer.organize_files()
+        finally:
+            if fadvise is not None:
+                os.posix_fadvise = fadvise
+        assert stats['files_moved'] == 0 and stats['errors'] == 13
+        assert os.path.exists(os.path.join(temp_dir, "test_image.jpg"))
+        assert organizer._cached_readback_warned or os.name == 'nt'
+    
+    # A destination that appears after the collision check is skipped, never removed
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, verify="metadata")
+        organizer._is_cross_device = lambda source, destination: True
+        precious = os.path.join(temp_dir, "images", "test_image.jpg")
+        
+        original_exists = os.path.exists
+        
+        def racing_exists(path):
+            found = original_exists(path)
+            if path == precious and not found:
+                with open(precious, 'w') as f:
+                    f.write("PRECIOUS")
+            return found
+        
+        os.path.exists = racing_exists
+        try:
+            stats = organizer.organize_files()
+        finally:
+            os.path.exists = original_exists
+        assert stats['files_skipped'] == 1 and stats['errors'] == 0
+        with open(precious) as f:
+            assert f.read() == "PRECIOUS"
+        assert os.path.exists(os.path.join(temp_dir, "test_image.jpg"))
+
+
+def test_incremental_link_view():
+    """Test that the linked view only touches links whose sources changed."""
+    for mode in ("symlink", "hardlink"):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            create_test_files(temp_dir)
+            view_dir = os.path.join(temp_dir, "organized_view")
+            organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+            
+            stats = organizer.sync_view(mode)
+            assert stats['links_created'] == 13 and stats['errors'] == 0
+            assert os.path.isfile(os.path.join(view_dir, "images", "test_image.jpg"))
+            assert os.path.isfile(os.path.join(temp_dir, "test_image.jpg"))
+            
+            os.rename(os.path.join(temp_dir, "test_image.jpg"), os.path.join(temp_dir, "renamed.jpg"))
+            os.remove(os.path.join(temp_dir, "unknown_file.xyz"))
+            stats = organizer.sync_view(mode)
+            assert stats == {'links_created': 1, 'links_removed': 2, 'links_kept': 11, 'errors': 0}
+            assert os.path.isfile(os.path.join(view_dir, "images", "renamed.jpg"))
+            assert not os.path.lexists(os.path.join(view_dir, "images", "test_image.jpg"))
+            assert not os.path.lexists(os.path.join(view_dir, "other", "unknown_file.xyz"))
+            
+            # A lost or corrupt index is rebuilt by adopting the links on disk
+            state_file = os.path.join(view_dir, ".organizer_view.json")
+            os.remove(state_file)
+            stats = organizer.sync_view(mode)
+            assert stats == {'links_created': 0, 'links_removed': 0, 'links_kept': 12, 'errors': 0}
+            with open(state_file, 'w') as f:
+                f.write("{not json")
+            os.remove(os.path.join(view_dir, "videos", "test_video.mp4"))
+            foreign = os.path.join(view_dir, "audio", "test_audio.mp3")
+            os.remove(foreign)
+            with open(foreign, 'w') as f:
+                f.write("not a link")
+            stats = organizer.sync_view(mode)
+            assert stats == {'links_created': 2, 'links_removed': 0, 'links_kept': 10, 'errors': 0}
+            assert organizer.sync_view(mode)['links_kept'] == 12
+        
+        # Switching the link type replaces every link of the previous mode
+        with tempfile.TemporaryDirectory() as temp_dir:
+            create_test_files(temp_dir)
+            view_dir = os.path.join(temp_dir, "organized_view")
+            organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+            other_mode = "hardlink" if mode == "symlink" else "symlink"
+            organizer.sync_view(other_mode)
+            stats = organizer.sync_view(mode)
+            assert stats == {'links_created': 13, 'links_removed': 13, 'links_kept': 0, 'errors': 0}
+            image_link = os.path.join(view_dir, "images", "test_image.jpg")
+            assert os.path.islink(image_link) == (mode == "symlink")
+
+
+def test_sampled_estimate():
+    """Test that estimates are exact for a full sample and bounded otherwise."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        os.makedirs(os.path.join(temp_dir, "images"))
+        shutil.copy(os.path.join(temp_dir, "test_image.jpg"), os.path.join(temp_dir, "images"))
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+        
+        result = organizer.estimate(sample_size=100)
+        assert result['files_total'] == 13 and result['sample_size'] == 13
+        assert result['categories']['images'] == (1.0, 0.0)
+        assert result['collisions'] == (1.0, 0.0)
+        assert result['moves'] == (12.0, 0.0)
+        
+        result = organizer.estimate(sample_size=5)
+        assert result['sample_size'] == 5
+        assert round(sum(count for count, _ in result['categories'].values())) == 13
+        assert all(margin > 0 for _, margin in result['categories'].values())
+        assert len(os.listdir(temp_dir)) == 14  # nothing was moved
+        
+        # Enumeration takes no stats, even with a layout whose planning needs them
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, layout="date")
+        scan_stats = []
+        organizer._scanned = lambda entry: scan_stats.append(entry) or entry.path
+        result = organizer.estimate(sample_size=5)
+        assert result['files_total'] == 13 and not scan_stats
+
+
+def test_ignore_rules():
+    """Test gitignore-style exclusions, negation and directory pruning."""
+    rules = IgnoreRules([".*", "*.tmp", "!keep.tmp", "!.env", "cache/", "/top.txt", "docs/**/*.md"])
+    assert rules.is_ignored("scratch.tmp")
+    assert not rules.is_ignored("keep.tmp")
+    assert rules.is_ignored(".hidden") and not rules.is_ignored(".env")
+    assert rules.is_ignored("cache", is_dir=True) and not rules.is_ignored("cache")
+    assert rules.is_ignored("cache/keep.tmp")  # pruned with its parent directory
+    assert rules.is_ignored("top.txt") and not rules.is_ignored("sub/top.txt")
+    assert rules.is_ignored("docs/a/b/notes.md")
+    assert rules.ignored_names(["a.tmp", "keep.tmp", ".env", "b.txt"]) == {"a.tmp"}
+    
+    with tempfile.TemporaryDirectory(suffix="organizer_logs") as temp_dir:
+        create_test_files(temp_dir)
+        for name in ("draft.tmp", "keep.tmp", ".env", ".DS_Store"):
+            with open(os.path.join(temp_dir, name), 'w') as f:
+                f.write(name)
+        with open(os.path.join(temp_dir, ".organizerignore"), 'w') as f:
+            f.write("# scratch files\n*.tmp\n!keep.tmp\n!.env\ntest_code.py\n")
+        
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+        names = sorted(os.path.basename(f) for f in organizer._get_files_to_organize())
+        assert "draft.tmp" not in names and "test_code.py" not in names and ".DS_Store" not in names
+        assert "keep.tmp" in names and ".env" in names
+        assert len(names) == 14
+
+
+def test_organizer_service():
+    """Test organize, stats, status and metrics requests over the service socket."""
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Unix domain sockets not available - skipping service test")
+        return
+    from organizer_service import OrganizerService, request
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target_dir = os.path.join(temp_dir, "drop")
+        os.makedirs(target_dir)
+        create_test_files(target_dir)
+        socket_path = os.path.join(temp_dir, "organizer.sock")
+        service = OrganizerService(socket_path, workers=2, max_organizers=1)
+        service.start()
+        try:
+            response = request({'op': 'stats', 'root': target_dir}, socket_path, timeout=10)
+            assert response['ok'] and response['result']['files_found'] == 13
+            
+            response = request({'op': 'organize', 'root': target_dir, 'wait': True}, socket_path, timeout=10)
+            assert response['status'] == 'done'
+            assert response['result']['files_moved'] == 13
+            assert os.path.isfile(os.path.join(target_dir, "images", "test_image.jpg"))
+            
+            response = request({'op': 'status', 'job': response['job']}, socket_path, timeout=10)
+            assert response['ok'] and response['status'] == 'done'
+            
+            metrics = request({'op': 'metrics'}, socket_path, timeout=10)['metrics']
+            assert metrics['jobs_completed'] == 2 and metrics['files_moved'] == 13
+            assert metrics['resident_organizers'] == 1
+            
+            # A second root replaces the least recently used organizer
+            other_dir = os.path.join(temp_dir, "other")
+            os.makedirs(other_dir)
+            create_test_files(other_dir)
+            response = request({'op': 'organize', 'root': other_dir, 'layout': 'date', 'dry_run': True,
+                                'wait': True}, socket_path, timeout=10)
+            assert response['status'] == 'done'
+            assert list(service._organizers) == [(other_dir, 'date')]
+            assert not service._organizers[(other_dir, 'date')]._stat_cache  # no stats held between jobs
+            assert request({'op': 'metrics'}, socket_path, timeout=10)['metrics']['resident_organizers'] == 1
+            
+            response = request({'op': 'organize', 'root': "relative/path"}, socket_path, timeout=10)
+            assert not response['ok']
+        finally:
+            service.stop()
+        assert not os.path.exists(socket_path)
+
+
+def test_run_history_regressions():
+    """Test that runs are recorded and throughput drops against the baseline are flagged."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        history_db = os.path.join(temp_dir, "history.sqlite3")
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, history_db=history_db)
+        organizer.organize_files()
+        
+        assert not organizer._stat_cache  # sizes for the history are not kept per file
+        
+        runs = organizer.get_history()
+        assert len(runs) == 1
+        assert runs[0]['files'] == 13 and runs[0]['files_moved'] == 13
+        assert runs[0]['bytes'] > 0 and runs[0]['files_per_sec'] > 0
+        assert set(runs[0]['phases']) == {'scan', 'plan', 'folders', 'move', 'report'}
+        assert not runs[0]['regression']
+        
+        # Four more runs at a steady 1000 files/s, then one at 400 files/s
+        connection = organizer._open_history()
+        with connection:
+            for i, files_per_sec in enumerate([1000, 1000, 1000, 1000, 400]):
+                connection.execute(
+                    "INSERT INTO runs (root, started, dry_run, duration, phases, files, bytes, files_per_sec,"
+                    " bytes_per_sec, files_moved, files_skipped, folders_created, errors, ruleset)"
+                    " VALUES (?, ?, 0, 1.0, '{\"move\": 1.0}', ?, 0, ?, 0, 0, 0, 0, 0, '')",
+                    (os.path.abspath(temp_dir), time.time() + i + 1, files_per_sec, files_per_sec))
+        connection.close()
+        
+        runs = organizer.show_history()
+        assert [run['regression'] for run in runs] == [False] * 5 + [True]
+        assert runs[-1]['baseline_files_per_sec'] == 1000
+        
+        # A deliberate rules change starts a new baseline instead of flagging the change
+        connection = organizer._open_history()
+        with connection:
+            connection.execute(
+                "INSERT INTO runs (root, started, dry_run, duration, phases, files, bytes, files_per_sec,"
+                " bytes_per_sec, files_moved, files_skipped, folders_created, errors, ruleset)"
+                " VALUES (?, ?, 0, 1.0, '{\"move\": 1.0}', 200, 0, 200, 0, 0, 0, 0, 0, 'new-rules')",
+                (os.path.abspath(temp_dir), time.time() + 10))
+        connection.close()
+        runs = organizer.get_history()
+        assert not runs[-1]['regression'] and runs[-1]['baseline_files_per_sec'] is None
+
+
+def test_cooperative_shards():
+    """Test that shards partition the files and never replace existing destinations."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        os.makedirs(os.path.join(temp_dir, "images"))
+        with open(os.path.join(temp_dir, "images", "test_image.jpg"), 'w') as f:
+            f.write("already sorted")
+        
+        shards = [DesktopOrganizer(target_dir=temp_dir, enable_logging=False, shard=(i, 3)) for i in range(3)]
+        selected = [set(organizer._get_files_to_organize()) for organizer in shards]
+        assert sum(len(files) for files in selected) == 13
+        assert len(set().union(*selected)) == 13
+        
+        results = [organizer.organize_files() for organizer in shards]
+        assert sum(stats['files_moved'] for stats in results) == 12
+        assert sum(stats['files_skipped'] for stats in results) == 1
+        assert sum(stats['errors'] for stats in results) == 0
+        with open(os.path.join(temp_dir, "images", "test_image.jpg")) as f:
+            assert f.read() == "already sorted"
+        assert os.path.isfile(os.path.join(temp_dir, "test_image.jpg"))
+    
+    assert parse_shard("2/4") == (2, 4)
+    for spec in ("4/4", "x/2", "1"):
+        try:
+            parse_shard(spec)
+            assert False, spec
+        except ValueError:
+            pass
+
+
+def test_lease_lock_expiry():
+    """Test that a lock blocks other holders until released or left unrefreshed for a lease."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        lock_path = os.path.join(temp_dir, "root.lock")
+        first = LeaseLock(lock_path, lease=60).acquire()
+        try:
+            LeaseLock(lock_path, lease=60, timeout=0.05).acquire()
+            assert False, "lock acquired twice"
+        except TimeoutError:
+            pass
+        first.release()
+        assert not os.path.exists(lock_path)
+        
+        # An old mtime alone (e.g. a host with a fast clock) does not break a lock...
+        LeaseLock(lock_path, lease=0.2).acquire()
+        os.utime(lock_path, (time.time() - 120, time.time() - 120))
+        try:
+            LeaseLock(lock_path, lease=0.2, timeout=0.1).acquire()
+            assert False, "lock broken before a full lease passed"
+        except TimeoutError:
+            pass
+        # ...but one left unrefreshed for a locally timed lease does
+        started = time.monotonic()
+        with LeaseLock(lock_path, lease=0.2, timeout=2):
+            assert time.monotonic() - started >= 0.2
+        assert not os.path.exists(lock_path)
+        
+        # A holder that keeps refreshing keeps its lock, and is waited for past
+        # the timeout (e.g. a long cross-device copy) rather than given up on
+        holder = LeaseLock(lock_path, lease=0.2).acquire()
+        acquired = []
+        waiter = threading.Thread(
+            target=lambda: acquired.append((LeaseLock(lock_path, lease=0.2, timeout=0.3).acquire(),
+                                            time.monotonic())))
+        with holder.keep_alive():
+            waiter.start()
+            time.sleep(1.0)
+            assert not acquired, "refreshed lock was broken"
+            released = time.monotonic()
+            holder.release()
+        waiter.join(5)
+        assert acquired and acquired[0][1] >= released
+        acquired[0][0].release()
+        
+        # A lock replaced between the stale check and the rename is put back
+        LeaseLock(lock_path, lease=0.1).acquire()
+        waiter = LeaseLock(lock_path, lease=0.1)
+        assert not waiter._break_if_expired()
+        time.sleep(0.15)
+        original_rename = os.rename
+        
+        def racing_rename(source, destination):
+            os.unlink(lock_path)
+            with open(lock_path, 'w') as f:
+                f.write("other-waiter\n")
+            os.rename = original_rename
+            original_rename(source, destination)
+        
+        os.rename = racing_rename
+        try:
+            assert not waiter._break_if_expired()
+        finally:
+            os.rename = original_rename
+        with open(lock_path) as f:
+            assert f.read() == "other-waiter\n"
+        assert os.listdir(temp_dir) == ["root.lock"]
+
+
+def test_cold_tier_migration():
+    """Test that untouched files move to the cold root and are recorded in the index."""
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cold_dir:
+        create_test_files(temp_dir)
+        old = time.time() - 400 * 86400
+        for name in ("test_document.pdf", "test_image.jpg"):
+            os.utime(os.path.join(temp_dir, name), (old, old))
+        
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, cold_root=cold_dir,
+                                     cold_after_days=180, cold_workers=2, cold_rate_limit=1024 * 1024)
+        stats = organizer.organize_files()
+        assert stats['files_moved'] == 13 and stats['errors'] == 0
+        assert os.path.exists(os.path.join(cold_dir, "documents", "test_document.pdf"))
+        assert os.path.exists(os.path.join(cold_dir, "images", "test_image.jpg"))
+        assert os.path.exists(os.path.join(temp_dir, "videos", "test_video.mp4"))
+        assert not os.path.exists(os.path.join(temp_dir, "images", "test_image.jpg"))
+        
+        with open(os.path.join(temp_dir, ".organizer_cold_index.jsonl")) as f:
+            index = [json.loads(line) for line in f]
+        assert sorted(entry['name'] for entry in index) == ["test_document.pdf", "test_image.jpg"]
+        assert all(entry['destination'].startswith(cold_dir) for entry in index)
+        
+        # Files sorted by an earlier run migrate once they go cold
+        sorted_video = os.path.join(temp_dir, "videos", "test_video.mp4")
+        os.utime(sorted_video, (old, old))
+        stats = organizer.organize_files()
+        assert stats['files_moved'] == 1 and stats['errors'] == 0
+        assert not os.path.exists(sorted_video)
+        assert os.path.exists(os.path.join(cold_dir, "videos", "test_video.mp4"))
+        with open(os.path.join(temp_dir, ".organizer_cold_index.jsonl")) as f:
+            assert len(f.readlines()) == 3
+        
+        # The ignore rules protect sorted files (and prune folders) as well
+        with open(os.path.join(temp_dir, ".organizerignore"), 'w') as f:
+            f.write("documents/keep/\n")
+        os.makedirs(os.path.join(temp_dir, "documents", "keep"))
+        for path in (os.path.join(temp_dir, "documents", "keep", "kept.pdf"),
+                     os.path.join(temp_dir, "documents", "stale.pdf")):
+            with open(path, 'w') as f:
+                f.write("old")
+            os.utime(path, (old, old))
+        stats = organizer.organize_files()
+        assert stats['files_moved'] == 1 and stats['errors'] == 0
+        assert os.path.exists(os.path.join(cold_dir, "documents", "stale.pdf"))
+        assert os.path.exists(os.path.join(temp_dir, "documents", "keep", "kept.pdf"))
+        
+        # Unexpected failures in the migration workers are not swallowed
+        os.utime(os.path.join(temp_dir, "audio", "test_audio.mp3"), (old, old))
+        
+        def broken_move(source, destination):
+            raise RuntimeError("worker failure")
+        
+        organizer._move_file = broken_move
+        try:
+            organizer.organize_files()
+            assert False, "worker exception was lost"
+        except RuntimeError:
+            pass
+        
+        try:
+            DesktopOrganizer(target_dir=temp_dir, enable_logging=False, cold_root=cold_dir)
+            assert False, "cold_root accepted without cold_after_days"
+        except ValueError:
+            pass
+
+
+def test_async_organizer():
+    """Test that the async organizer streams every move and can be stopped midway."""
+    import asyncio
+    from async_organizer import AsyncOrganizer, organize_many
+    
+    async def collect(organizer, limit=None):
+        results = []
+        async for result in organizer.stream():
+            results.append(result)
+            if len(results) == limit:
+                break
+        return results
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = AsyncOrganizer(temp_dir, concurrency=3, enable_logging=False)
+        results = asyncio.run(collect(organizer))
+        assert len(results) == 13 and all(result['moved'] for result in results)
+        assert organizer.stats['files_moved'] == 13 and organizer.stats['errors'] == 0
+        assert os.path.exists(os.path.join(temp_dir, "images", "test_image.jpg"))
+    
+    # Leaving the stream early stops the run; stats cover what was actually moved
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        organizer = AsyncOrganizer(temp_dir, concurrency=2, enable_logging=False)
+        asyncio.run(collect(organizer, limit=2))
+        assert organizer.cancelled
+        left = [name for name in os.listdir(temp_dir) if os.path.isfile(os.path.join(temp_dir, name))]
+        assert organizer.stats['files_moved'] == 13 - len(left) < 13
+    
+    # Cancelling during the cold phase stops the migrations before the task returns
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cold_dir:
+        old = time.time() - 400 * 86400
+        for i in range(20):
+            path = os.path.join(temp_dir, f"old_{i:02d}.pdf")
+            with open(path, 'wb') as f:
+                f.write(b"x" * 1000)
+            os.utime(path, (old, old))
+        organizer = AsyncOrganizer(temp_dir, enable_logging=False, cold_root=cold_dir, cold_after_days=180,
+                                   cold_workers=2, cold_rate_limit=10000)
+        
+        async def cancel_cold_run():
+            try:
+                await asyncio.wait_for(organizer.organize(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+        
+        asyncio.run(cancel_cold_run())
+        assert organizer.cancelled and organizer.organizer._stats_lock is None
+        migrated = len(os.listdir(os.path.join(cold_dir, "documents")))
+        assert organizer.stats['files_moved'] == migrated < 20
+        time.sleep(0.5)
+        assert len(os.listdir(os.path.join(cold_dir, "documents"))) == migrated
+    
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        create_test_files(first)
+        create_test_files(second)
+        stats = asyncio.run(organize_many([first, second], concurrency=4, enable_logging=False))
+        assert [result['files_moved'] for result in stats.values()] == [13, 13]
+
+
+def test_getdents_reader():
+    """Test that the getdents64 reader finds exactly what scandir finds."""
+    if load_getdents64() is None:
+        print("getdents64 not available on this platform, skipping")
+        return
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_test_files(temp_dir)
+        for i in range(300):
+            with open(os.path.join(temp_dir, f"IMG_{i:04d}_\u00e9t\u00e9.jpg"), "w") as f:
+                f.write("x")
+        os.mkdir(os.path.join(temp_dir, "folder.jpg"))
+        os.symlink(os.path.join(temp_dir, "test_image.jpg"), os.path.join(temp_dir, "link.jpg"))
+        os.symlink(os.path.join(temp_dir, "folder.jpg"), os.path.join(temp_dir, "dirlink.jpg"))
+        
+        # The minimum buffer holds only a few dozen records, forcing many calls
+        names = {entry.name for entry in iter_getdents(temp_dir, 4096)}
+        assert names == set(os.listdir(temp_dir))
+        
+        scandir_files = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)._get_files_to_organize()
+        getdents_files = DesktopOrganizer(target_dir=temp_dir, enable_logging=False, reader="getdents",
+                                          getdents_buffer=4096)._get_files_to_organize()
+        assert len(getdents_files) == 13 + 300 + 1
+        assert sorted(getdents_files) == sorted(scandir_files)
+
+
+def test_profile_harness():
+    """Test that --profile writes per-phase snapshots, a CPU profile and comparable summaries."""
+    from organizer_profiler import OrganizerProfiler, compare
+    
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as profile_dir:
+        create_test_files(temp_dir)
+        organizer = DesktopOrganizer(target_dir=temp_dir, enable_logging=False)
+        profiler = OrganizerProfiler(organizer, profile_dir, top=5, cpu=True)
+        stats = profiler.run()
+        assert stats['files_moved'] == 13
+        assert '_start_phase' not in organizer.__dict__
+        
+        with open(os.path.join(profiler.run_dir, "summary.json")) as f:
+            summary = json.load(f)
+        phases = [phase['phase'] for phase in summary['phases']]
+        assert phases == ["start", "scan", "plan", "folders", "move", "report"]
+        assert len(os.listdir(os.path.join(profiler.run_dir, "snapshots"))) == len(phases)
+        assert os.path.exists(os.path.join(profiler.run_dir, "cpu_move.pstats"))
+        assert os.path.exists(os.path.join(profiler.run_dir, "memory.txt"))
+        
+        report = compare(profiler.run_dir, profiler.run_dir)
+        assert "after move" in report
+
+
 if __name__ == "__main__":
     test_organizer()
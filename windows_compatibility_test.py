@@ -164,7 +164,7 @@ def test_windows_environment():
     print()
     print("RECOMMENDATIONS FOR WINDOWS USERS:")
     print("1. Use desktop_organizer.bat for easiest setup (no Python required)")
-    print("2. If using Python scripts, ensure Python 3.6+ is installed")
+    print("2. If using Python scripts, ensure Python 3.7+ is installed")
     print("3. All scripts use %USERPROFILE%\\Desktop for maximum compatibility")
     print("4. Test with dry-run mode first before organizing files")
     print("5. Scripts handle Windows file paths and permissions correctly")